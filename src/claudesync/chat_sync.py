@@ -80,9 +80,12 @@ def sync_chat(
         chat_folder = os.path.join(chat_destination, chat["uuid"])
         os.makedirs(chat_folder, exist_ok=True)
 
+        # List the chat folder once instead of checking for each file separately
+        existing_files = set(os.listdir(chat_folder))
+
         # Save chat metadata
         metadata_file = os.path.join(chat_folder, "metadata.json")
-        if not os.path.exists(metadata_file):
+        if "metadata.json" not in existing_files:
             with open(metadata_file, "w") as f:
                 json.dump(chat, f, indent=2)
 
@@ -92,13 +95,15 @@ def sync_chat(
 
         # Process each message in the chat
         for message in full_chat["chat_messages"]:
-            message_file = os.path.join(chat_folder, f"{message['uuid']}.json")
+            message_file_name = f"{message['uuid']}.json"
 
             # Skip processing if the message file already exists
-            if os.path.exists(message_file):
+            if message_file_name in existing_files:
                 logger.debug(f"Skipping existing message {message['uuid']}")
                 continue
 
+            message_file = os.path.join(chat_folder, message_file_name)
+
             # Save the message
             with open(message_file, "w") as f:
                 json.dump(message, f, indent=2)
@@ -118,15 +123,16 @@ def save_artifacts(artifacts, chat_folder, message):
     logger.info(f"Found {len(artifacts)} artifacts in message {message['uuid']}")
     artifact_folder = os.path.join(chat_folder, "artifacts")
     os.makedirs(artifact_folder, exist_ok=True)
+    existing_files = set(os.listdir(artifact_folder))
     for artifact in artifacts:
         # Save each artifact
-        artifact_file = os.path.join(
-            artifact_folder,
-            f"{artifact['identifier']}.{get_file_extension(artifact['type'])}",
+        artifact_file_name = (
+            f"{artifact['identifier']}.{get_file_extension(artifact['type'])}"
         )
-        if not os.path.exists(artifact_file):
-            with open(artifact_file, "w") as f:
+        if artifact_file_name not in existing_files:
+            with open(os.path.join(artifact_folder, artifact_file_name), "w") as f:
                 f.write(artifact["content"])
+            existing_files.add(artifact_file_name)
 
 
 def get_file_extension(artifact_type):
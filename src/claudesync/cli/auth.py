@@ -1,8 +1,6 @@
 import click
 
-from claudesync.provider_factory import get_provider
 from ..exceptions import ProviderError
-from ..utils import handle_errors
 
 
 @click.group()
@@ -30,19 +28,20 @@ def auth():
     help="Automatically approve the suggested expiry time",
 )
 @click.pass_context
-@handle_errors
 def login(ctx, provider, session_key, auto_approve):
     """Authenticate with an AI provider."""
+    from ..provider_factory import get_provider
+
     config = ctx.obj
-    provider_instance = get_provider(config, provider)
 
     try:
+        # Reject a malformed session key before building the provider
+        if session_key and not session_key.startswith("sk-ant"):
+            raise ProviderError("Invalid sessionKey format. Must start with 'sk-ant'")
+
+        provider_instance = get_provider(config, provider)
         if session_key:
             # If session key is provided, bypass the interactive prompt
-            if not session_key.startswith("sk-ant"):
-                raise ProviderError(
-                    "Invalid sessionKey format. Must start with 'sk-ant'"
-                )
             # Set auto_approve to True when session key is provided
             provider_instance._auto_approve_expiry = auto_approve
             provider_instance._provided_session_key = session_key
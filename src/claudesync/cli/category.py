@@ -1,5 +1,4 @@
 import click
-from ..utils import handle_errors
 
 
 @click.group()
@@ -15,7 +14,6 @@ def category():
     "--patterns", required=True, multiple=True, help="File patterns for the category"
 )
 @click.pass_obj
-@handle_errors
 def add(config, name, description, patterns):
     """Add a new file category."""
     config.add_file_category(name, description, list(patterns))
@@ -25,7 +23,6 @@ def add(config, name, description, patterns):
 @category.command()
 @click.argument("name")
 @click.pass_obj
-@handle_errors
 def rm(config, name):
     """Remove a file category."""
     config.remove_file_category(name)
@@ -37,7 +34,6 @@ def rm(config, name):
 @click.option("--description", help="New description for the category")
 @click.option("--patterns", multiple=True, help="New file patterns for the category")
 @click.pass_obj
-@handle_errors
 def update(config, name, description, patterns):
     """Update an existing file category."""
     config.update_file_category(name, description, list(patterns) if patterns else None)
@@ -46,7 +42,6 @@ def update(config, name, description, patterns):
 
 @category.command()
 @click.pass_obj
-@handle_errors
 def ls(config):
     """List all file categories."""
     categories = config.get("file_categories", {})
@@ -64,7 +59,6 @@ def ls(config):
 @category.command()
 @click.argument("category", required=True)
 @click.pass_obj
-@handle_errors
 def set_default(config, category):
     """Set the default category for synchronization."""
     config.set_default_category(category)
@@ -1,13 +1,39 @@
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import PurePath
 
 import click
 import logging
 from ..exceptions import ProviderError
-from ..utils import handle_errors, validate_and_get_provider
-from ..chat_sync import sync_chats
+from ..utils import validate_and_get_provider
 
 logger = logging.getLogger(__name__)
 
+# Batch sizes tried in turn when deleting all chats. The delete_many endpoint may cap
+# the number of UUIDs per request, so fall back to smaller batches when a round fails,
+# and finally to one request per chat.
+DELETE_BATCH_SIZES = (1000, 500, 250, 50, 1)
+
+# Number of concurrent requests when deleting chats one at a time
+DELETE_WORKERS = 16
+
+# Number of chats written to stdout at a time by chat ls
+LIST_WRITE_BATCH_SIZE = 100
+
+# Number of streamed completion chunks written before stdout is flushed
+STREAM_FLUSH_INTERVAL = 32
+
+
+def _chat_row(chat):
+    """Return the UUID, name, project name and update time shown for a chat."""
+    project = chat.get("project")
+    return (
+        chat.get("uuid", "Unknown"),
+        chat.get("name", "Unnamed"),
+        project.get("name", "") if project else "",
+        chat.get("updated_at", "Unknown"),
+    )
+
 
 @click.group()
 def chat():
@@ -17,134 +43,251 @@ def chat():
 
 @chat.command()
 @click.pass_obj
-@handle_errors
 def pull(config):
     """Synchronize chats and their artifacts from the remote source."""
+    from ..chat_sync import sync_chats
+
     provider = validate_and_get_provider(config, require_project=True)
     sync_chats(provider, config)
 
 
 @chat.command()
 @click.pass_obj
-@handle_errors
 def ls(config):
     """List all chats."""
     provider = validate_and_get_provider(config)
     organization_id = config.get("active_organization_id")
-    chats = provider.get_chat_conversations(organization_id)
 
-    for chat in chats:
-        project = chat.get("project")
-        project_name = project.get("name") if project else ""
-        click.echo(
-            f"UUID: {chat.get('uuid', 'Unknown')}, "
-            f"Name: {chat.get('name', 'Unnamed')}, "
-            f"Project: {project_name}, "
-            f"Updated: {chat.get('updated_at', 'Unknown')}"
+    # Write the listing in batches of lines so large organizations don't pay one
+    # click.echo call per chat, while chats still appear as they are streamed in
+    stdout = click.get_text_stream("stdout")
+    lines = []
+    for chat in provider.iter_chat_conversations(organization_id):
+        uuid, name, project_name, updated_at = _chat_row(chat)
+        lines.append(
+            f"UUID: {uuid}, Name: {name}, Project: {project_name}, "
+            f"Updated: {updated_at}\n"
         )
+        if len(lines) >= LIST_WRITE_BATCH_SIZE:
+            stdout.write("".join(lines))
+            lines.clear()
+    stdout.write("".join(lines))
+    stdout.flush()
 
 
 @chat.command()
 @click.option("-a", "--all", "delete_all", is_flag=True, help="Delete all chats")
+@click.option(
+    "--parallel",
+    type=click.IntRange(min=1),
+    default=8,
+    show_default=True,
+    help="Number of delete requests to run concurrently when deleting all chats",
+)
 @click.pass_obj
-@handle_errors
-def rm(config, delete_all):
+def rm(config, delete_all, parallel):
     """Delete chat conversations. Use -a to delete all chats, or run without -a to select specific chats to delete."""
     provider = validate_and_get_provider(config)
     organization_id = config.get("active_organization_id")
 
     if delete_all:
-        delete_all_chats(provider, organization_id)
+        delete_all_chats(provider, organization_id, parallel)
     else:
-        delete_single_chat(provider, organization_id)
+        delete_selected_chats(provider, organization_id)
+
 
+def delete_chats(provider, organization_id, uuids, quiet=False):
+    """
+    Delete a list of chats by their UUIDs.
 
-def delete_chats(provider, organization_id, uuids):
-    """Delete a list of chats by their UUIDs."""
+    With `quiet`, a failure is only logged at debug level instead of being reported,
+    for requests that are expected to fail, such as probing for the batch size.
+    """
     try:
         result = provider.delete_chat(organization_id, uuids)
         return len(result), 0
     except ProviderError as e:
-        logger.error(f"Error deleting chats: {str(e)}")
-        click.echo(f"Error occurred while deleting chats: {str(e)}")
+        if quiet:
+            logger.debug(f"Error deleting {len(uuids)} chats: {str(e)}")
+        else:
+            logger.error(f"Error deleting chats: {str(e)}")
+            click.echo(f"Error occurred while deleting chats: {str(e)}")
         return 0, len(uuids)
 
 
-def delete_all_chats(provider, organization_id):
-    """Delete all chats for the given organization."""
-    if click.confirm("Are you sure you want to delete all chats?"):
+def delete_chats_individually(provider, organization_id, uuids):
+    """Delete chats with one request per UUID, running the requests concurrently."""
+    total_deleted = total_failed = 0
+    with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+        for deleted, failed in executor.map(
+            lambda uuid: delete_chats(provider, organization_id, [uuid]), uuids
+        ):
+            total_deleted += deleted
+            total_failed += failed
+    return total_deleted, total_failed
+
+
+def delete_all_chats(provider, organization_id, parallel=8):
+    """
+    Delete all chats for the given organization.
+
+    The chats are deleted in batches that are as large as the backend accepts, trying
+    DELETE_BATCH_SIZES in turn, and up to `parallel` batches are deleted concurrently.
+    The first chat list is fetched while the confirmation prompt is shown, and the list
+    is fetched again after each round until it is empty or even the smallest batch size
+    fails to delete anything. Rejected batches are expected while the batch size is
+    found, so only the chats that can't be deleted on their own are reported, once each.
+    """
+    with ThreadPoolExecutor(max_workers=parallel) as executor:
+        # Fetch the chat list while the user is still answering the prompt
+        first_fetch = executor.submit(provider.get_chat_conversations, organization_id)
+        if not click.confirm("Are you sure you want to delete all chats?"):
+            return
+
+        chats = first_fetch.result()
         total_deleted = 0
-        with click.progressbar(length=100, label="Deleting chats") as bar:
-            while True:
-                chats = provider.get_chat_conversations(organization_id)
-                if not chats:
+        failed_uuids = set()
+        batch_sizes = iter(DELETE_BATCH_SIZES)
+        batch_size = next(batch_sizes)
+        with click.progressbar(
+            length=len(chats),
+            label="Deleting chats",
+            show_eta=True,
+            show_percent=True,
+        ) as bar:
+            while chats:
+                uuids = [
+                    chat["uuid"] for chat in chats if chat["uuid"] not in failed_uuids
+                ]
+                if not uuids:
                     break
-                uuids_to_delete = [chat["uuid"] for chat in chats[:50]]
-                deleted, _ = delete_chats(provider, organization_id, uuids_to_delete)
-                total_deleted += deleted
-                bar.update(len(uuids_to_delete))
-        click.echo(f"Chat deletion complete. Total chats deleted: {total_deleted}")
+                batches = [
+                    uuids[i : i + batch_size] for i in range(0, len(uuids), batch_size)
+                ]
+                futures = {
+                    executor.submit(
+                        delete_chats,
+                        provider,
+                        organization_id,
+                        batch,
+                        quiet=batch_size > 1,
+                    ): batch
+                    for batch in batches
+                }
+                round_deleted = 0
+                # Advance the bar as each batch finishes, whatever order they finish in
+                for future in as_completed(futures):
+                    deleted, failed = future.result()
+                    round_deleted += deleted
+                    bar.update(deleted)
+                    if failed and batch_size == 1:
+                        failed_uuids.update(futures[future])
+                total_deleted += round_deleted
+                if not round_deleted:
+                    batch_size = next(batch_sizes, None)
+                    if batch_size is None:
+                        break
+                chats = provider.get_chat_conversations(organization_id)
+    click.echo(f"Chat deletion complete. Total chats deleted: {total_deleted}")
+    if failed_uuids:
+        noun = "chat" if len(failed_uuids) == 1 else "chats"
+        click.echo(f"Failed to delete {len(failed_uuids)} {noun}.")
 
 
-def delete_single_chat(provider, organization_id):
-    """Delete a single chat selected by the user."""
+def delete_selected_chats(provider, organization_id):
+    """Delete the chats selected by the user in a single request."""
     chats = provider.get_chat_conversations(organization_id)
     if not chats:
         click.echo("No chats found.")
         return
 
     display_chat_list(chats)
-    selected_chat = get_chat_selection(chats)
-    if selected_chat:
-        confirm_and_delete_chat(provider, organization_id, selected_chat)
+    selected_chats = get_chat_selection(chats)
+    if selected_chats:
+        confirm_and_delete_chats(provider, organization_id, selected_chats)
 
 
 def display_chat_list(chats):
     """Display a list of chats to the user."""
-    click.echo("Available chats:")
+    lines = ["Available chats:"]
     for idx, chat in enumerate(chats, 1):
-        project = chat.get("project")
-        project_name = project.get("name") if project else ""
-        click.echo(
-            f"{idx}. Name: {chat.get('name', 'Unnamed')}, "
-            f"Project: {project_name}, Updated: {chat.get('updated_at', 'Unknown')}"
+        _, name, project_name, updated_at = _chat_row(chat)
+        lines.append(
+            f"{idx}. Name: {name}, Project: {project_name}, Updated: {updated_at}"
         )
+    click.echo("\n".join(lines))
+
+
+def parse_chat_selection(selection, count):
+    """
+    Parse a selection such as "1,3,5-7" into chat numbers.
+
+    Args:
+        selection (str): Comma-separated chat numbers and inclusive ranges.
+        count (int): The number of chats that can be selected.
+
+    Returns:
+        list: The selected chat numbers in ascending order, without duplicates.
+
+    Raises:
+        ValueError: If the selection is malformed or a number is out of range.
+    """
+    numbers = set()
+    for part in selection.split(","):
+        start, _, end = part.strip().partition("-")
+        start = int(start)
+        end = int(end) if end else start
+        if not 1 <= start <= end <= count:
+            raise ValueError(f"Invalid selection: {part.strip()}")
+        numbers.update(range(start, end + 1))
+    return sorted(numbers)
 
 
 def get_chat_selection(chats):
-    """Get a valid chat selection from the user."""
+    """Get a valid selection of one or more chats from the user."""
     while True:
         selection = click.prompt(
-            "Enter the number of the chat to delete (or 'q' to quit)", type=str
+            "Enter the numbers of the chats to delete, e.g. 1,3,5-7 (or 'q' to quit)",
+            type=str,
         )
         if selection.lower() == "q":
             return None
         try:
-            selection = int(selection)
-            if 1 <= selection <= len(chats):
-                return chats[selection - 1]
-            click.echo("Invalid selection. Please try again.")
+            return [
+                chats[number - 1]
+                for number in parse_chat_selection(selection, len(chats))
+            ]
         except ValueError:
-            click.echo("Invalid input. Please enter a number or 'q' to quit.")
+            click.echo(
+                "Invalid selection. Please enter chat numbers or ranges, or 'q' to quit."
+            )
 
 
-def confirm_and_delete_chat(provider, organization_id, chat):
-    """Confirm deletion with the user and delete the selected chat."""
-    if click.confirm(
-        f"Are you sure you want to delete the chat '{chat.get('name', 'Unnamed')}'?"
-    ):
-        deleted, _ = delete_chats(provider, organization_id, [chat["uuid"]])
+def confirm_and_delete_chats(provider, organization_id, chats):
+    """Confirm deletion with the user and delete the selected chats."""
+    # The chat list shown to the user is reused here, so the delete_many call is the
+    # only request made after the prompt. It has no prepare step that could be started
+    # while the user confirms, and urllib opens a new connection per request, so
+    # warming one up during the prompt would not help.
+    noun = "chat" if len(chats) == 1 else "chats"
+    names = ", ".join(f"'{chat.get('name', 'Unnamed')}'" for chat in chats)
+    if click.confirm(f"Are you sure you want to delete the {noun} {names}?"):
+        uuids = [chat["uuid"] for chat in chats]
+        deleted, _ = delete_chats(provider, organization_id, uuids)
+        if not deleted and len(uuids) > 1:
+            # The batch may have been rejected as a whole, so try each chat on its own
+            deleted, _ = delete_chats_individually(provider, organization_id, uuids)
+
         if deleted:
-            click.echo(f"Successfully deleted chat: {chat.get('name', 'Unnamed')}")
+            click.echo(f"Successfully deleted {noun}: {names}")
         else:
-            click.echo(f"Failed to delete chat: {chat.get('name', 'Unnamed')}")
+            click.echo(f"Failed to delete {noun}: {names}")
 
 
 @chat.command()
 @click.option("--name", default="", help="Name of the chat conversation")
 @click.option("--project", help="UUID of the project to associate the chat with")
 @click.pass_obj
-@handle_errors
 def init(config, name, project):
     """Initializes a new chat conversation on the active provider."""
     provider = validate_and_get_provider(config)
@@ -192,7 +335,6 @@ def init(config, name, project):
     + "Or any custom model string. If not specified, uses the default model.",
 )
 @click.pass_obj
-@handle_errors
 def message(config, message, chat, timezone, model):
     """Send a message to a specified chat or create a new chat and send the message."""
     provider = validate_and_get_provider(config, require_project=True)
@@ -200,7 +342,8 @@ def message(config, message, chat, timezone, model):
     active_project_id = config.get("active_project_id")
     active_project_name = config.get("active_project_name")
 
-    message = " ".join(message)  # Join all message parts into a single string
+    # Join all message parts into a single string
+    message = message[0] if len(message) == 1 else " ".join(message)
 
     try:
         chat = create_chat(
@@ -215,15 +358,25 @@ def message(config, message, chat, timezone, model):
         if chat is None:
             return
 
-        # Send message and process the streaming response
+        # Send message and process the streaming response, writing the text straight to
+        # stdout and flushing on newlines or every STREAM_FLUSH_INTERVAL events
+        stdout = click.get_text_stream("stdout")
+        pending = 0
         for event in provider.send_message(
             active_organization_id, chat, message, timezone, model
         ):
-            if "completion" in event:
-                click.echo(event["completion"], nl=False)
-            elif "content" in event:
-                click.echo(event["content"], nl=False)
-            elif "error" in event:
+            text = event.get("completion") or event.get("content")
+            if text:
+                stdout.write(text)
+                pending += 1
+                if "\n" in text or pending >= STREAM_FLUSH_INTERVAL:
+                    stdout.flush()
+                    pending = 0
+                continue
+
+            stdout.flush()
+            pending = 0
+            if "error" in event:
                 click.echo(f"\nError: {event['error']}")
             elif "message_limit" in event:
                 click.echo(
@@ -275,14 +428,12 @@ def select_project(
         return None
 
     # Filter projects to include only the active project and its submodules
+    submodule_prefix = f"{active_project_name}-SubModule-"
     filtered_projects = [
         p
         for p in all_projects
         if p["id"] == active_project_id
-        or (
-            p["name"].startswith(f"{active_project_name}-SubModule-")
-            and not p.get("archived_at")
-        )
+        or (p["name"].startswith(submodule_prefix) and not p.get("archived_at"))
     ]
 
     if not filtered_projects:
@@ -296,15 +447,16 @@ def select_project(
         config, active_project_id, active_project_name, current_dir, filtered_projects
     )
 
-    click.echo("Available projects:")
+    lines = ["Available projects:"]
     for idx, proj in enumerate(filtered_projects, 1):
         project_type = (
             "Active Project" if proj["id"] == active_project_id else "Submodule"
         )
         default_marker = " (default)" if idx - 1 == default_project else ""
-        click.echo(
+        lines.append(
             f"{idx}. {proj['name']} (ID: {proj['id']}) - {project_type}{default_marker}"
         )
+    click.echo("\n".join(lines))
 
     while True:
         prompt = "Enter the number of the project to associate with the chat"
@@ -330,19 +482,23 @@ def get_default_project(
     if not local_path:
         return None
 
-    # Find the project that matches the current directory
-    default_project = None
+    # Index the project paths, then walk up from the current directory so the deepest
+    # matching project wins when submodules are nested inside each other
+    base_path = os.path.abspath(local_path)
+    submodule_prefix = f"{active_project_name}-SubModule-"
+    project_indexes = {}
     for idx, proj in enumerate(filtered_projects):
         if proj["id"] == active_project_id:
-            project_path = os.path.abspath(local_path)
+            project_path = base_path
         else:
-            submodule_name = proj["name"].replace(
-                f"{active_project_name}-SubModule-", ""
+            submodule_name = proj["name"].replace(submodule_prefix, "")
+            project_path = os.path.normpath(
+                os.path.join(base_path, "services", submodule_name)
             )
-            project_path = os.path.abspath(
-                os.path.join(local_path, "services", submodule_name)
-            )
-        if current_dir.startswith(project_path):
-            default_project = idx
-            break
-    return default_project
+        project_indexes.setdefault(project_path, idx)
+
+    current_path = PurePath(current_dir)
+    for path in (current_path, *current_path.parents):
+        if str(path) in project_indexes:
+            return project_indexes[str(path)]
+    return None
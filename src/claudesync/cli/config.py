@@ -4,7 +4,6 @@ import click
 
 from .category import category
 from ..exceptions import ConfigurationError
-from ..utils import handle_errors
 
 
 @click.group()
@@ -17,7 +16,6 @@ def config():
 @click.argument("key")
 @click.argument("value")
 @click.pass_obj
-@handle_errors
 def set(config, key, value):
     """Set a configuration value."""
     # Check if the key exists in the configuration
@@ -46,7 +44,6 @@ def set(config, key, value):
 @config.command()
 @click.argument("key")
 @click.pass_obj
-@handle_errors
 def get(config, key):
     """Get a configuration value."""
     value = config.get(key)
@@ -58,12 +55,10 @@ def get(config, key):
 
 @config.command()
 @click.pass_obj
-@handle_errors
 def ls(config):
     """List all configuration values."""
-    # Combine global and local configurations
-    combined_config = config.global_config.copy()
-    combined_config.update(config.local_config)
+    # Combine global and local configurations, local values taking precedence
+    combined_config = {**config.global_config, **config.local_config}
 
     # Print the combined configuration as JSON
     click.echo(json.dumps(combined_config, indent=2, sort_keys=True))
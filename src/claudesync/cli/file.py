@@ -1,5 +1,5 @@
 import click
-from ..utils import handle_errors, validate_and_get_provider
+from ..utils import validate_and_get_provider
 
 
 @click.group()
@@ -10,7 +10,6 @@ def file():
 
 @file.command()
 @click.pass_obj
-@handle_errors
 def ls(config):
     """List files in the active remote project."""
     provider = validate_and_get_provider(config, require_project=True)
@@ -20,10 +19,11 @@ def ls(config):
     if not files:
         click.echo("No files found in the active project.")
     else:
-        click.echo(
+        lines = [
             f"Files in project '{config.get('active_project_name')}' (ID: {active_project_id}):"
-        )
+        ]
         for file in files:
-            click.echo(
+            lines.append(
                 f"  - {file['file_name']} (ID: {file['uuid']}, Created: {file['created_at']})"
             )
+        click.echo("\n".join(lines))
@@ -0,0 +1,37 @@
+import importlib
+
+import click
+
+
+class LazyGroup(click.Group):
+    """
+    A click group that imports its subcommands only when they are invoked.
+
+    Subcommands are registered as a mapping of command name to the dotted import path of the
+    command object, e.g. {"auth": "claudesync.cli.auth.auth"}. The module behind a subcommand
+    is imported the first time that subcommand is looked up, so running one command does not
+    pay the import cost of every other command module.
+    """
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            return self._lazy_load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _lazy_load(self, cmd_name):
+        import_path = self.lazy_subcommands[cmd_name]
+        module_name, attr_name = import_path.rsplit(".", 1)
+        module = importlib.import_module(module_name)
+        cmd_object = getattr(module, attr_name)
+        if not isinstance(cmd_object, click.Command):
+            raise ValueError(
+                f"Lazy loading of {import_path} failed by returning a non-command object"
+            )
+        return cmd_object
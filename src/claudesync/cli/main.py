@@ -1,41 +1,84 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
 
 import click
-import click_completion
-import click_completion.core
-import json
-import subprocess
-import urllib.request
-from pkg_resources import get_distribution
-
-from claudesync.cli.chat import chat
+
 from claudesync.configmanager import FileConfigManager, InMemoryConfigManager
-from claudesync.syncmanager import SyncManager
+from claudesync.exceptions import ConfigurationError, ProviderError
 from claudesync.utils import (
-    handle_errors,
     validate_and_get_provider,
     get_local_files,
+    write_json_atomic,
 )
-from .auth import auth
-from .organization import organization
-from .project import project
-from .sync import schedule
-from .config import config
+from .lazy_group import LazyGroup
 import logging
 
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-)
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for PyPI when checking for the latest version
+PYPI_TIMEOUT = 5
+# Seconds to reuse the latest version found on PyPI before checking again
+PYPI_CACHE_TTL = 6 * 60 * 60
+
+
+class ClaudeSyncGroup(LazyGroup):
+    """
+    The root command group, which is the single error boundary for every subcommand.
 
-click_completion.init()
+    ConfigurationError and ProviderError raised anywhere below this group are reported to the user
+    as a friendly error message instead of a full traceback.
+    """
 
+    def invoke(self, ctx):
+        try:
+            return super().invoke(ctx)
+        except (ConfigurationError, ProviderError) as e:
+            click.echo(f"Error: {str(e)}")
 
-@click.group()
+
+@click.group(
+    cls=ClaudeSyncGroup,
+    lazy_subcommands={
+        "auth": "claudesync.cli.auth.auth",
+        "organization": "claudesync.cli.organization.organization",
+        "project": "claudesync.cli.project.project",
+        "schedule": "claudesync.cli.sync.schedule",
+        "config": "claudesync.cli.config.config",
+        "chat": "claudesync.cli.chat.chat",
+    },
+)
+@click.option("-v", "--verbose", is_flag=True, help="Show debug log messages")
 @click.pass_context
-def cli(ctx):
+def cli(ctx, verbose):
     """ClaudeSync: Synchronize local files with AI projects."""
     if ctx.obj is None:
         ctx.obj = FileConfigManager()  # InMemoryConfigManager() for testing with mock
+    configure_logging(ctx.obj, verbose)
+
+
+def configure_logging(config, verbose=False):
+    """
+    Sets up log output once a command actually runs, rather than at import time.
+
+    Only the claudesync loggers use the configured log level; other libraries stay at
+    WARNING so they don't add to the output. An unknown log level falls back to INFO,
+    so a bad setting can still be fixed with 'claudesync config set'.
+
+    Args:
+        config: config manager to read the log_level setting from
+        verbose (bool): Log at DEBUG level regardless of the configured log level.
+    """
+    logging.basicConfig(
+        level=logging.WARNING, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    level = logging.DEBUG
+    if not verbose:
+        log_level = config.get("log_level", "INFO")
+        level = logging.getLevelName(str(log_level).upper())
+        if not isinstance(level, int):
+            logger.warning(f"Unknown log_level '{log_level}', using INFO instead")
+            level = logging.INFO
+    logging.getLogger("claudesync").setLevel(level)
 
 
 @cli.command()
@@ -44,6 +87,10 @@ def cli(ctx):
 )
 def install_completion(shell):
     """Install completion for the specified shell."""
+    import click_completion
+    import click_completion.core
+
+    click_completion.init()
     if shell is None:
         shell = click_completion.get_auto_shell()
         click.echo("Shell is set to '%s'" % shell)
@@ -51,19 +98,122 @@ def install_completion(shell):
     click.echo("Completion installed.")
 
 
+def _read_pypi_cache(cache_file):
+    """
+    Reads the cached answer of the last PyPI version check.
+
+    Args:
+        cache_file (Path): The cache file to read.
+
+    Returns:
+        dict: The cached version, ETag and fetch time, or an empty dict if there is no
+            usable cache.
+    """
+    import json
+
+    try:
+        with open(cache_file, "r") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if (
+        isinstance(cache, dict)
+        and isinstance(cache.get("version"), str)
+        and isinstance(cache.get("fetched_at"), (int, float))
+    ):
+        return cache
+    return {}
+
+
+def _fetch_pypi_version(cache):
+    """
+    Asks PyPI for the latest ClaudeSync version, revalidating the cached answer if any.
+
+    Args:
+        cache (dict): The cached answer as returned by _read_pypi_cache.
+
+    Returns:
+        tuple: The latest version and PyPI's ETag for it.
+    """
+    import gzip
+    import json
+    import urllib.error
+    import urllib.request
+
+    # The package JSON includes the release history, so ask for it compressed
+    headers = {"Accept-Encoding": "gzip"}
+    if cache.get("etag"):
+        headers["If-None-Match"] = cache["etag"]
+    request = urllib.request.Request(
+        "https://pypi.org/pypi/claudesync/json", headers=headers
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=PYPI_TIMEOUT) as response:
+            body = response
+            if response.headers.get("Content-Encoding") == "gzip":
+                body = gzip.GzipFile(fileobj=response)
+            return json.load(body)["info"]["version"], response.headers.get("ETag")
+    except urllib.error.HTTPError as e:
+        if e.code != 304:
+            raise
+        return cache["version"], cache["etag"]
+
+
+def _get_latest_version(force_check=False):
+    """
+    Looks up the latest ClaudeSync version on PyPI.
+
+    The answer is cached in ~/.claudesync/pypi_cache.json and reused for PYPI_CACHE_TTL
+    seconds, so repeated upgrade checks don't wait on PyPI each time. Once it expires,
+    PyPI is asked with the cached ETag and only sends the metadata again if it changed.
+
+    Args:
+        force_check (bool): Ask PyPI even if a cached answer is still fresh.
+
+    Returns:
+        str: The latest version published on PyPI.
+    """
+    import time
+
+    cache_file = Path.home() / ".claudesync" / "pypi_cache.json"
+    cache = _read_pypi_cache(cache_file)
+    if cache and not force_check and time.time() - cache["fetched_at"] < PYPI_CACHE_TTL:
+        return cache["version"]
+
+    latest_version, etag = _fetch_pypi_version(cache)
+    try:
+        write_json_atomic(
+            cache_file,
+            {"version": latest_version, "etag": etag, "fetched_at": time.time()},
+        )
+    except OSError as e:
+        logger.debug(f"Unable to cache the latest version: {e}")
+    return latest_version
+
+
 @cli.command()
+@click.option(
+    "--force-check",
+    is_flag=True,
+    help="Check PyPI for the latest version even if a recent result is cached",
+)
 @click.pass_context
-def upgrade(ctx):
+def upgrade(ctx, force_check):
     """Upgrade ClaudeSync to the latest version and reset configuration, preserving sessionKey."""
-    current_version = get_distribution("claudesync").version
+    import os
+    import subprocess
+    import sys
+    from importlib.metadata import version
+
+    import claudesync
+
+    current_version = version("claudesync")
+    target_version = "the latest version"
 
     # Check for the latest version
     try:
-        with urllib.request.urlopen(
-            "https://pypi.org/pypi/claudesync/json"
-        ) as response:
-            data = json.loads(response.read())
-            latest_version = data["info"]["version"]
+        latest_version = _get_latest_version(force_check)
+        target_version = f"v{latest_version}"
 
         if current_version == latest_version:
             click.echo(
@@ -74,10 +224,37 @@ def upgrade(ctx):
         click.echo(f"Unable to check for the latest version: {str(e)}")
         click.echo("Proceeding with the upgrade process.")
 
+    # pip can't replace an install in a location we can't write to, so point the user
+    # at the right command instead of letting pip resolve the upgrade and then fail
+    if not os.access(os.path.dirname(claudesync.__file__), os.W_OK):
+        if "pipx" in Path(sys.prefix).parts:
+            command = "pipx upgrade claudesync"
+        else:
+            command = "pip install --user --upgrade claudesync"
+        click.echo(
+            f"ClaudeSync is installed in a location you can't write to. "
+            f"Please upgrade it with: {command}"
+        )
+        return
+
     # Upgrade ClaudeSync
-    click.echo(f"Upgrading ClaudeSync from v{current_version} to v{latest_version}...")
+    click.echo(f"Upgrading ClaudeSync from v{current_version} to {target_version}...")
     try:
-        subprocess.run(["pip", "install", "--upgrade", "claudesync"], check=True)
+        # Run pip from this interpreter so the upgrade lands in the same environment
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "pip",
+                "install",
+                "--upgrade",
+                "--disable-pip-version-check",
+                "--no-input",
+                "--quiet",
+                "claudesync",
+            ],
+            check=True,
+        )
         click.echo("ClaudeSync has been successfully upgraded.")
     except subprocess.CalledProcessError:
         click.echo(
@@ -87,7 +264,7 @@ def upgrade(ctx):
     # Inform user about the upgrade process
     click.echo("\nUpgrade process completed:")
     click.echo(
-        f"1. ClaudeSync has been upgraded from v{current_version} to v{latest_version}."
+        f"1. ClaudeSync has been upgraded from v{current_version} to {target_version}."
     )
     click.echo("2. Your session key has been preserved (if it existed and was valid).")
     click.echo(
@@ -95,14 +272,41 @@ def upgrade(ctx):
     )
 
 
+def _get_sync_concurrency(config):
+    """
+    Reads the number of projects push syncs concurrently from the configuration.
+
+    Args:
+        config: The config manager to read the sync_concurrency setting from.
+
+    Returns:
+        int: The configured number of projects.
+
+    Raises:
+        ConfigurationError: If the setting isn't a positive whole number.
+    """
+    value = config.get("sync_concurrency", 4)
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        raise ConfigurationError(
+            f"sync_concurrency must be a positive whole number, not '{value}'. "
+            "Use 'claudesync config set sync_concurrency 4' to fix it."
+        )
+    return value
+
+
 @cli.command()
 @click.option("--category", help="Specify the file category to sync")
 @click.option(
     "--uberproject", is_flag=True, help="Include submodules in the parent project sync"
 )
+@click.option(
+    "--parallel",
+    type=click.IntRange(min=1),
+    help="Number of projects, including submodules, to sync concurrently "
+    "[default: the sync_concurrency setting]",
+)
 @click.pass_obj
-@handle_errors
-def push(config, category, uberproject):
+def push(config, category, uberproject, parallel):
     """Synchronize the project files, optionally including submodules in the parent project."""
     provider = validate_and_get_provider(config, require_project=True)
 
@@ -111,9 +315,8 @@ def push(config, category, uberproject):
         if category:
             click.echo(f"Using default category: {category}")
 
-    active_organization_id = config.get("active_organization_id")
-    active_project_id = config.get("active_project_id")
-    active_project_name = config.get("active_project_name")
+    if parallel is None:
+        parallel = _get_sync_concurrency(config)
     local_path = config.get_local_path()
 
     if not local_path:
@@ -125,14 +328,19 @@ def push(config, category, uberproject):
 
     # Detect if we're in a submodule
     current_dir = Path.cwd()
+    local_root = Path(local_path)
     submodules = config.get("submodules", [])
-    current_submodule = next(
+    submodule_dirs = [local_root / sm["relative_path"] for sm in submodules]
+    submodule_paths = [str(submodule_dir) for submodule_dir in submodule_dirs]
+    current_submodule, current_submodule_path = next(
         (
-            sm
-            for sm in submodules
-            if Path(local_path) / sm["relative_path"] == current_dir
+            (sm, path)
+            for sm, submodule_dir, path in zip(
+                submodules, submodule_dirs, submodule_paths
+            )
+            if submodule_dir == current_dir
         ),
-        None,
+        (None, None),
     )
 
     if current_submodule:
@@ -140,68 +348,204 @@ def push(config, category, uberproject):
         click.echo(
             f"Syncing submodule {current_submodule['active_project_name']} [{current_dir}]"
         )
-        sync_submodule(provider, config, current_submodule, category)
-    else:
-        # Sync main project
-        sync_manager = SyncManager(provider, config, config.get_local_path())
-        remote_files = provider.list_files(active_organization_id, active_project_id)
-
-        if uberproject:
-            # Include submodule files in the parent project
-            local_files = get_local_files(
-                config, local_path, category, include_submodules=True
+        click.echo(
+            sync_submodule(
+                provider, config, current_submodule, category, current_submodule_path
             )
-        else:
-            # Exclude submodule files from the parent project
-            local_files = get_local_files(
-                config, local_path, category, include_submodules=False
+        )
+    else:
+        failed = sync_main_project(
+            provider,
+            config,
+            local_path,
+            category,
+            uberproject,
+            parallel,
+            submodules,
+            submodule_paths,
+        )
+        if failed:
+            # Exit with an error so scripts and CI notice the failed projects
+            raise click.ClickException(
+                f"{failed} of {len(submodules) + 1} projects failed to sync."
             )
 
-        sync_manager.sync(local_files, remote_files)
-        click.echo(
-            f"Main project '{active_project_name}' synced successfully: https://claude.ai/project/{active_project_id}"
-        )
 
-        # Always sync submodules to their respective projects
-        for submodule in submodules:
-            sync_submodule(provider, config, submodule, category)
+def sync_main_project(
+    provider,
+    config,
+    local_path,
+    category,
+    uberproject,
+    parallel,
+    submodules,
+    submodule_paths,
+):
+    """
+    Synchronizes the main project, and each submodule with the submodule's own project.
+
+    Each project is reported as soon as its sync is done. A project that fails to sync
+    is reported without stopping the others. With uberproject or two-way sync, the
+    submodules are only synced once the main project is done. Progress bars are only
+    shown when one project syncs at a time.
+
+    Args:
+        provider: The provider to sync with.
+        config: The main project's config manager.
+        local_path (str): The main project's local path.
+        category (str): The file category to sync, or None for all files.
+        uberproject (bool): Include the submodules' files in the main project as well.
+        parallel (int): The number of projects to sync concurrently.
+        submodules (list): The submodule entries from the main project's config.
+        submodule_paths (list): The submodules' local paths, in the same order.
+
+    Returns:
+        int: The number of projects that failed to sync.
+    """
+    from claudesync.syncmanager import SyncManager
 
+    active_project_id = config.get("active_project_id")
+    active_project_name = config.get("active_project_name")
+    # Progress bars of projects syncing at the same time would be drawn over each other
+    show_progress = parallel == 1 or not submodules
+    sync_manager = SyncManager(provider, config, local_path, show_progress)
+
+    # Fetch the remote file list and read and hash the submodules' files while
+    # the main project's local files are read and hashed. The main project and
+    # each submodule have their own remote project, so they are then synced side
+    # by side unless their local files may overlap
+    with ThreadPoolExecutor(max_workers=parallel) as executor:
+        remote_future = executor.submit(
+            provider.list_files,
+            config.get("active_organization_id"),
+            active_project_id,
+        )
+        submodule_futures = [
+            executor.submit(get_local_files, config, path, category)
+            for path in submodule_paths
+        ]
+        # Only include submodule files in the parent project with --uberproject
+        local_files = get_local_files(
+            config, local_path, category, include_submodules=uberproject
+        )
+        remote_files = remote_future.result()
 
-def sync_submodule(provider, config, submodule, category):
-    submodule_path = Path(config.get_local_path()) / submodule["relative_path"]
-    submodule_files = get_local_files(config, str(submodule_path), category)
-    remote_submodule_files = provider.list_files(
-        submodule["active_organization_id"], submodule["active_project_id"]
-    )
+        def sync_main():
+            sync_manager.sync(local_files, remote_files)
+            return (
+                f"Main project '{active_project_name}' synced successfully: "
+                f"https://claude.ai/project/{active_project_id}"
+            )
+
+        main_future = executor.submit(sync_main)
+        futures = {main_future: active_project_name}
+
+        # With --uberproject the main project syncs the submodules' files too, and with
+        # two-way sync it can write local files, so the main project has to finish
+        # before the submodules start
+        if uberproject or config.get("two_way_sync"):
+            wait([main_future])
+
+        # Always sync submodules to their respective projects, reading the parent
+        # config and session keys once for all of them
+        if submodules:
+            base_config = InMemoryConfigManager()
+            base_config.load_from_file_config(config)
+            for submodule, path, future in zip(
+                submodules, submodule_paths, submodule_futures
+            ):
+                submodule_future = executor.submit(
+                    sync_submodule,
+                    provider,
+                    config,
+                    submodule,
+                    category,
+                    path,
+                    base_config,
+                    future.result(),
+                    show_progress,
+                )
+                futures[submodule_future] = submodule["active_project_name"]
+
+        # Report each project as soon as it is done, and keep syncing the others
+        # if one of them fails
+        failed = 0
+        for future in as_completed(futures):
+            try:
+                click.echo(future.result())
+            except (ConfigurationError, ProviderError) as e:
+                click.echo(f"Error: Failed to sync '{futures[future]}': {str(e)}")
+                failed += 1
+    return failed
+
+
+def sync_submodule(
+    provider,
+    config,
+    submodule,
+    category,
+    submodule_path,
+    base_config=None,
+    local_files=None,
+    show_progress=True,
+):
+    """
+    Synchronizes a submodule's files with the submodule's own project.
+
+    Args:
+        provider: The provider to sync with.
+        config: The parent project's config manager.
+        submodule (dict): The submodule entry from the parent project's config.
+        category (str): The file category to sync, or None for all files.
+        submodule_path (str): The submodule's local path.
+        base_config (InMemoryConfigManager, optional): A snapshot of `config` to build the
+            submodule's config from, shared when syncing several submodules.
+        local_files (dict, optional): The submodule's local files as returned by
+            get_local_files, if they were already collected.
+        show_progress (bool, optional): Show progress bars while syncing.
+
+    Returns:
+        str: The message reporting that the submodule was synced.
+    """
+    from claudesync.syncmanager import SyncManager
+
+    if local_files is not None:
+        submodule_files = local_files
+        remote_submodule_files = provider.list_files(
+            submodule["active_organization_id"], submodule["active_project_id"]
+        )
+    else:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            remote_future = executor.submit(
+                provider.list_files,
+                submodule["active_organization_id"],
+                submodule["active_project_id"],
+            )
+            submodule_files = get_local_files(config, submodule_path, category)
+            remote_submodule_files = remote_future.result()
 
     # Create a new ConfigManager instance for the submodule
     submodule_config = InMemoryConfigManager()
-    submodule_config.load_from_file_config(config)
-    submodule_config.set(
-        "active_project_id", submodule["active_project_id"], local=True
-    )
-    submodule_config.set(
-        "active_project_name", submodule["active_project_name"], local=True
+    submodule_config.load_from_file_config(base_config or config)
+    submodule_config.set_many(
+        {
+            "active_project_id": submodule["active_project_id"],
+            "active_project_name": submodule["active_project_name"],
+        },
+        local=True,
     )
 
     # Create a new SyncManager for the submodule
     submodule_sync_manager = SyncManager(
-        provider, submodule_config, str(submodule_path)
+        provider, submodule_config, submodule_path, show_progress
     )
 
     submodule_sync_manager.sync(submodule_files, remote_submodule_files)
-    click.echo(
+    return (
         f"Submodule '{submodule['active_project_name']}' synced successfully: "
         f"https://claude.ai/project/{submodule['active_project_id']}"
     )
 
 
-cli.add_command(auth)
-cli.add_command(organization)
-cli.add_command(project)
-cli.add_command(schedule)
-cli.add_command(config)
-cli.add_command(chat)
-
 if __name__ == "__main__":
     cli()
@@ -1,5 +1,5 @@
 import click
-from ..utils import handle_errors, validate_and_get_provider
+from ..utils import validate_and_get_provider
 
 
 @click.group()
@@ -10,7 +10,6 @@ def organization():
 
 @organization.command()
 @click.pass_obj
-@handle_errors
 def ls(config):
     """List all available organizations with required capabilities."""
     provider = validate_and_get_provider(config, require_org=False)
@@ -34,7 +33,6 @@ def ls(config):
     help="Specify the provider for repositories without .claudesync",
 )
 @click.pass_context
-@handle_errors
 def set(ctx, org_id, provider):
     """Set the active organization."""
     config = ctx.obj
@@ -91,8 +89,9 @@ def set(ctx, org_id, provider):
             click.echo("Invalid selection. Please try again.")
 
     # Clear project-related settings when changing organization
-    config.set("active_project_id", None, local=True)
-    config.set("active_project_name", None, local=True)
+    config.set_many(
+        {"active_project_id": None, "active_project_name": None}, local=True
+    )
     click.echo(
         "Project settings cleared. Please select or create a new project for this organization."
     )
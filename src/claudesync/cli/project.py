@@ -3,8 +3,7 @@ import os
 import logging
 
 from tqdm import tqdm
-from ..provider_factory import get_provider
-from ..utils import handle_errors, validate_and_get_provider
+from ..utils import validate_and_get_provider
 from ..exceptions import ProviderError, ConfigurationError
 from .file import file
 from .submodule import submodule
@@ -13,6 +12,12 @@ from ..syncmanager import retry_on_403
 logger = logging.getLogger(__name__)
 
 
+def _project_label(project):
+    """Return how a project is shown in project lists, marking archived projects."""
+    status = " (Archived)" if project.get("archived_at") else ""
+    return f"{project['name']} (ID: {project['id']}){status}"
+
+
 @click.group()
 def project():
     """Manage AI projects within the active organization."""
@@ -54,7 +59,6 @@ def project():
     help="The provider to use for this project",
 )
 @click.pass_context
-@handle_errors
 def init(ctx, name, description, local_path, new, provider):
     """Initialize a new project configuration.
 
@@ -69,10 +73,11 @@ def init(ctx, name, description, local_path, new, provider):
     os.makedirs(claudesync_dir, exist_ok=True)
 
     # Set basic configuration
-    config.set("active_provider", provider, local=True)
-    config.set("local_path", local_path, local=True)
+    config.set_many({"active_provider": provider, "local_path": local_path}, local=True)
 
     if new:
+        from ..provider_factory import get_provider
+
         # Create remote project if --new flag is specified
         provider_instance = get_provider(config, provider)
 
@@ -93,9 +98,14 @@ def init(ctx, name, description, local_path, new, provider):
             )
 
             # Update configuration with remote details
-            config.set("active_organization_id", organization, local=True)
-            config.set("active_project_id", new_project["uuid"], local=True)
-            config.set("active_project_name", new_project["name"], local=True)
+            config.set_many(
+                {
+                    "active_organization_id": organization,
+                    "active_project_id": new_project["uuid"],
+                    "active_project_name": new_project["name"],
+                },
+                local=True,
+            )
 
             click.echo("\nProject created:")
             click.echo(f"  - Project location: {local_path}")
@@ -144,7 +154,6 @@ def create(ctx, **kwargs):
     help="Skip confirmation prompt",
 )
 @click.pass_obj
-@handle_errors
 def archive(config, archive_all, yes):
     """Archive existing projects."""
     provider = validate_and_get_provider(config)
@@ -157,9 +166,9 @@ def archive(config, archive_all, yes):
 
     if archive_all:
         if not yes:
-            click.echo("The following projects will be archived:")
-            for project in projects:
-                click.echo(f"  - {project['name']} (ID: {project['id']})")
+            lines = ["The following projects will be archived:"]
+            lines.extend(f"  - {_project_label(project)}" for project in projects)
+            click.echo("\n".join(lines))
             if not click.confirm("Are you sure you want to archive all projects?"):
                 click.echo("Operation cancelled.")
                 return
@@ -184,9 +193,10 @@ def archive(config, archive_all, yes):
 
 
 def single_project_archival(projects, yes, provider, active_organization_id):
-    click.echo("Available projects to archive:")
+    lines = ["Available projects to archive:"]
     for idx, project in enumerate(projects, 1):
-        click.echo(f"  {idx}. {project['name']} (ID: {project['id']})")
+        lines.append(f"  {idx}. {_project_label(project)}")
+    click.echo("\n".join(lines))
 
     selection = click.prompt("Enter the number of the project to archive", type=int)
     if 1 <= selection <= len(projects):
@@ -216,7 +226,6 @@ def single_project_archival(projects, yes, provider, active_organization_id):
     help="Specify the provider for repositories without .claudesync",
 )
 @click.pass_context
-@handle_errors
 def set(ctx, show_all, provider):
     """Set the active project for syncing."""
     config = ctx.obj
@@ -255,22 +264,31 @@ def set(ctx, show_all, provider):
         click.echo("No active projects found.")
         return
 
-    click.echo("Available projects:")
+    submodule_prefix = f"{active_project_name}-SubModule-"
+    lines = ["Available projects:"]
     for idx, project in enumerate(selectable_projects, 1):
         project_type = (
-            "Main Project"
-            if not project["name"].startswith(f"{active_project_name}-SubModule-")
-            else "Submodule"
+            "Submodule"
+            if project["name"].startswith(submodule_prefix)
+            else "Main Project"
+        )
+        lines.append(
+            f"  {idx}. {project['name']} (ID: {project['id']}) - {project_type}"
         )
-        click.echo(f"  {idx}. {project['name']} (ID: {project['id']}) - {project_type}")
+    click.echo("\n".join(lines))
 
     selection = click.prompt(
         "Enter the number of the project to select", type=int, default=1
     )
     if 1 <= selection <= len(selectable_projects):
         selected_project = selectable_projects[selection - 1]
-        config.set("active_project_id", selected_project["id"], local=True)
-        config.set("active_project_name", selected_project["name"], local=True)
+        config.set_many(
+            {
+                "active_project_id": selected_project["id"],
+                "active_project_name": selected_project["name"],
+            },
+            local=True,
+        )
         click.echo(
             f"Selected project: {selected_project['name']} (ID: {selected_project['id']})"
         )
@@ -297,7 +315,6 @@ def set(ctx, show_all, provider):
     help="Include archived projects in the list",
 )
 @click.pass_obj
-@handle_errors
 def ls(config, show_all):
     """List all projects in the active organization."""
     provider = validate_and_get_provider(config)
@@ -306,10 +323,9 @@ def ls(config, show_all):
     if not projects:
         click.echo("No projects found.")
     else:
-        click.echo("Remote projects:")
-        for project in projects:
-            status = " (Archived)" if project.get("archived_at") else ""
-            click.echo(f"  - {project['name']} (ID: {project['id']}){status}")
+        lines = ["Remote projects:"]
+        lines.extend(f"  - {_project_label(project)}" for project in projects)
+        click.echo("\n".join(lines))
 
 
 @project.command()
@@ -319,7 +335,6 @@ def ls(config, show_all):
 @click.option("--all", "truncate_all", is_flag=True, help="Truncate all projects")
 @click.option("-y", "--yes", is_flag=True, help="Skip confirmation prompt")
 @click.pass_obj
-@handle_errors
 def truncate(config, include_archived, truncate_all, yes):
     """Truncate one or all projects."""
     provider = validate_and_get_provider(config)
@@ -335,10 +350,9 @@ def truncate(config, include_archived, truncate_all, yes):
 
     if truncate_all:
         if not yes:
-            click.echo("This will delete ALL files from the following projects:")
-            for project in projects:
-                status = " (Archived)" if project.get("archived_at") else ""
-                click.echo(f"  - {project['name']} (ID: {project['id']}){status}")
+            lines = ["This will delete ALL files from the following projects:"]
+            lines.extend(f"  - {_project_label(project)}" for project in projects)
+            click.echo("\n".join(lines))
             if not click.confirm(
                 "Are you sure you want to continue? This may take some time."
             ):
@@ -355,10 +369,10 @@ def truncate(config, include_archived, truncate_all, yes):
         click.echo("All files have been deleted from all projects.")
         return
 
-    click.echo("Available projects:")
+    lines = ["Available projects:"]
     for idx, project in enumerate(projects, 1):
-        status = " (Archived)" if project.get("archived_at") else ""
-        click.echo(f"  {idx}. {project['name']} (ID: {project['id']}){status}")
+        lines.append(f"  {idx}. {_project_label(project)}")
+    click.echo("\n".join(lines))
 
     selection = click.prompt("Enter the number of the project to truncate", type=int)
     if 1 <= selection <= len(projects):
@@ -4,7 +4,6 @@ import os
 import click
 from claudesync.exceptions import ProviderError
 from ..utils import (
-    handle_errors,
     validate_and_get_provider,
     detect_submodules,
 )
@@ -18,7 +17,6 @@ def submodule():
 
 @submodule.command()
 @click.pass_obj
-@handle_errors
 def ls(config):
     """List all detected submodules in the current project."""
     local_path = config.get_local_path()
@@ -42,7 +40,6 @@ def ls(config):
 
 @submodule.command()
 @click.pass_obj
-@handle_errors
 def create(config):
     """Creates new projects for each detected submodule that doesn't already exist remotely."""
     provider = validate_and_get_provider(config, require_project=True)
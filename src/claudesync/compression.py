@@ -21,22 +21,28 @@ def decompress_files(local_path, compressed_content, algorithm):
 
 
 def _pack_files(local_path, local_files):
-    packed_content = io.StringIO()
-    for file_path, file_hash in local_files.items():
+    parts = []
+    for file_path in local_files:
         full_path = os.path.join(local_path, file_path)
         with open(full_path, "r", encoding="utf-8") as f:
             content = f.read()
-        packed_content.write(f"--- BEGIN FILE: {file_path} ---\n")
-        packed_content.write(content)
-        packed_content.write(f"\n--- END FILE: {file_path} ---\n")
-    return packed_content.getvalue()
+        parts.extend(
+            (
+                f"--- BEGIN FILE: {file_path} ---\n",
+                content,
+                f"\n--- END FILE: {file_path} ---\n",
+            )
+        )
+    return "".join(parts)
 
 
 def _unpack_files(local_path, decompressed_content):
     current_file = None
     current_content = io.StringIO()
 
-    for line in decompressed_content.splitlines():
+    # Iterate over the lines lazily instead of building a list of all of them
+    for line in io.StringIO(decompressed_content):
+        line = line.rstrip("\n")
         if line.startswith("--- BEGIN FILE:"):
             if current_file:
                 _write_file(local_path, current_file, current_content.getvalue())
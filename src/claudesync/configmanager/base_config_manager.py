@@ -35,6 +35,7 @@ class BaseConfigManager(ABC):
         return {
             "log_level": "INFO",
             "upload_delay": 0.5,
+            "sync_concurrency": 4,
             "max_file_size": 32 * 1024,
             "two_way_sync": False,
             "prune_remote_files": True,
@@ -186,6 +187,22 @@ class BaseConfigManager(ABC):
         """
         pass
 
+    def set_many(self, values, local=False):
+        """
+        Sets several configuration values at once.
+
+        Args:
+            values (dict): A mapping of configuration keys to the values to set.
+            local (bool): Whether to set the configuration in the local context.
+                          If False, the settings are stored in the global context.
+                          Default is False.
+
+        Subclasses that persist their configuration should override this method to
+        write the configuration only once for the whole batch.
+        """
+        for key, value in values.items():
+            self.set(key, value, local=local)
+
     @abstractmethod
     def get(self, key, default=None):
         """
@@ -6,6 +6,7 @@ import logging
 
 from claudesync.configmanager.base_config_manager import BaseConfigManager
 from claudesync.session_key_manager import SessionKeyManager
+from claudesync.utils import write_json_atomic
 
 
 class FileConfigManager(BaseConfigManager):
@@ -31,6 +32,7 @@ class FileConfigManager(BaseConfigManager):
         self.local_config = {}
         self.local_config_dir = None
         self._load_local_config()
+        self._session_key_cache = {}
 
     def _load_global_config(self):
         """
@@ -65,20 +67,13 @@ class FileConfigManager(BaseConfigManager):
             Path: The path containing the .claudesync folder, or None if not found.
         """
         current_dir = Path.cwd()
-        root_dir = Path(current_dir.root)
-        home_dir = Path.home()
-        depth = 0
+        global_config_dir = Path.home() / ".claudesync"
 
-        while current_dir != root_dir:
-            claudesync_dir = current_dir / ".claudesync"
-            if claudesync_dir.is_dir() and claudesync_dir != home_dir / ".claudesync":
-                return current_dir
-
-            current_dir = current_dir.parent
-            depth += 1
-
-            if depth > max_depth:
-                return None
+        # Walk the ancestors directly, leaving out the filesystem root
+        for directory in [current_dir, *current_dir.parents][:-1][: max_depth + 1]:
+            claudesync_dir = directory / ".claudesync"
+            if claudesync_dir != global_config_dir and claudesync_dir.is_dir():
+                return directory
 
         return None
 
@@ -142,17 +137,28 @@ class FileConfigManager(BaseConfigManager):
             value (any): The value to set for the given key.
             local (bool): If True, sets the value in the local configuration. Otherwise, sets it in the global configuration.
         """
+        self.set_many({key: value}, local=local)
+
+    def set_many(self, values, local=False):
+        """
+        Sets several configuration values and saves the configuration once.
+
+        Args:
+            values (dict): A mapping of configuration keys to the values to set.
+            local (bool): If True, sets the values in the local configuration. Otherwise, sets them in the
+                global configuration.
+        """
         if local:
             # Update local_config_dir when setting local_path
-            if key == "local_path":
-                self.local_config_dir = Path(value)
+            if "local_path" in values:
+                self.local_config_dir = Path(values["local_path"])
                 # Create .claudesync directory in the specified path
                 (self.local_config_dir / ".claudesync").mkdir(exist_ok=True)
 
-            self.local_config[key] = value
+            self.local_config.update(values)
             self._save_local_config()
         else:
-            self.global_config[key] = value
+            self.global_config.update(values)
             self._save_global_config()
 
     def _save_global_config(self):
@@ -162,8 +168,7 @@ class FileConfigManager(BaseConfigManager):
         This method writes the current state of the `global_config` attribute to the configuration file,
         pretty-printing the JSON for readability.
         """
-        with open(self.global_config_file, "w") as f:
-            json.dump(self.global_config, f, indent=2)
+        write_json_atomic(self.global_config_file, self.global_config, indent=2)
 
     def _save_local_config(self):
         """
@@ -174,8 +179,7 @@ class FileConfigManager(BaseConfigManager):
                 self.local_config_dir / ".claudesync" / "config.local.json"
             )
             local_config_file.parent.mkdir(exist_ok=True)
-            with open(local_config_file, "w") as f:
-                json.dump(self.local_config, f, indent=2)
+            write_json_atomic(local_config_file, self.local_config, indent=2)
 
     def set_session_key(self, provider, session_key, expiry):
         """
@@ -194,15 +198,15 @@ class FileConfigManager(BaseConfigManager):
 
             self.global_config_dir.mkdir(parents=True, exist_ok=True)
             provider_key_file = self.global_config_dir / f"{provider}.key"
-            with open(provider_key_file, "w") as f:
-                json.dump(
-                    {
-                        "session_key": encrypted_session_key,
-                        "session_key_encryption_method": encryption_method,
-                        "session_key_expiry": expiry.isoformat(),
-                    },
-                    f,
-                )
+            write_json_atomic(
+                provider_key_file,
+                {
+                    "session_key": encrypted_session_key,
+                    "session_key_encryption_method": encryption_method,
+                    "session_key_expiry": expiry.isoformat(),
+                },
+            )
+            self._session_key_cache.pop(provider, None)
         except RuntimeError as e:
             logging.error(f"Failed to encrypt session key: {str(e)}")
             raise
@@ -211,12 +215,33 @@ class FileConfigManager(BaseConfigManager):
         """
         Retrieves the session key for the specified provider if it's still valid.
 
+        The key file is read and decrypted only on the first call for a provider; later calls
+        reuse the decrypted key until it is replaced or cleared.
+
         Args:
             provider (str): The name of the provider.
 
         Returns:
             tuple: A tuple containing the session key and expiry if valid, (None, None) otherwise.
         """
+        if provider not in self._session_key_cache:
+            self._session_key_cache[provider] = self._load_session_key(provider)
+
+        session_key, expiry = self._session_key_cache[provider]
+        if not session_key or datetime.now() > expiry:
+            return None, None
+        return session_key, expiry
+
+    def _load_session_key(self, provider):
+        """
+        Reads and decrypts the session key file for the specified provider.
+
+        Args:
+            provider (str): The name of the provider.
+
+        Returns:
+            tuple: A tuple containing the session key and expiry, or (None, None) if no valid key is stored.
+        """
         provider_key_file = self.global_config_dir / f"{provider}.key"
         if not provider_key_file.exists():
             return None, None
@@ -305,6 +330,7 @@ class FileConfigManager(BaseConfigManager):
         """
         for file in self.global_config_dir.glob("*.key"):
             os.remove(file)
+        self._session_key_cache.clear()
 
     def get_active_provider(self):
         """
@@ -67,10 +67,22 @@ class InMemoryConfigManager(BaseConfigManager):
                           If False, the setting is stored in the global context.
                           Default is False.
         """
+        self.set_many({key: value}, local=local)
+
+    def set_many(self, values, local=False):
+        """
+        Sets several configuration values in the in-memory store.
+
+        Args:
+            values (dict): A mapping of configuration keys to the values to set.
+            local (bool): Whether to set the configuration in the local context.
+                          If False, the settings are stored in the global context.
+                          Default is False.
+        """
         if local:
-            self.local_config[key] = value
+            self.local_config.update(values)
         else:
-            self.global_config[key] = value
+            self.global_config.update(values)
 
     def get(self, key, default=None):
         """
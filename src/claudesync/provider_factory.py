@@ -1,7 +1,21 @@
 # src/claudesync/provider_factory.py
 
+import importlib
+from functools import lru_cache
+
 from .providers.base_provider import BaseProvider
-from .providers.claude_ai import ClaudeAIProvider
+
+# Maps provider names to the "module:class" path of their implementation
+_PROVIDERS = {
+    "claude.ai": "claudesync.providers.claude_ai:ClaudeAIProvider",
+    # Add other providers here as they are implemented
+}
+
+
+@lru_cache(maxsize=None)
+def _load_provider_class(provider_name):
+    module_name, class_name = _PROVIDERS[provider_name].split(":")
+    return getattr(importlib.import_module(module_name), class_name)
 
 
 def get_provider(config=None, provider_name=None) -> BaseProvider:
@@ -12,6 +26,9 @@ def get_provider(config=None, provider_name=None) -> BaseProvider:
     providers. If a provider name is not specified, it returns a list of available provider names. If a provider
     name is specified but not found in the registry, it raises a ValueError.
 
+    The registry is built once at import time and each provider module is imported on first use only, so
+    listing the available providers never imports any provider implementation.
+
     Args:
         config: for testing
         provider_name (str, optional): The name of the provider to retrieve. If None, returns a list of available
@@ -23,16 +40,10 @@ def get_provider(config=None, provider_name=None) -> BaseProvider:
     Raises:
         ValueError: If the specified provider_name is not found in the registry of providers.
     """
-    providers = {
-        "claude.ai": ClaudeAIProvider,
-        # Add other providers here as they are implemented
-    }
-
     if provider_name is None:
-        return list(providers.keys())
+        return list(_PROVIDERS)
 
-    provider_class = providers.get(provider_name)
-    if provider_class is None:
+    if provider_name not in _PROVIDERS:
         raise ValueError(f"Unsupported provider: {provider_name}")
 
-    return provider_class(config)
+    return _load_provider_class(provider_name)(config)
@@ -1,6 +1,8 @@
+import codecs
 import datetime
 import json
 import logging
+import time
 import urllib
 import sseclient
 
@@ -15,6 +17,118 @@ def is_url_encoded(s):
     return decoded_s != s
 
 
+_LOGIN_INSTRUCTIONS = "\n".join(
+    [
+        "To obtain your session key, please follow these steps:",
+        "1. Open your web browser and go to https://claude.ai",
+        "2. Log in to your Claude account if you haven't already",
+        "3. Once logged in, open your browser's developer tools:",
+        "   - Chrome/Edge: Press F12 or Ctrl+Shift+I (Cmd+Option+I on Mac)",
+        "   - Firefox: Press F12 or Ctrl+Shift+I (Cmd+Option+I on Mac)",
+        "   - Safari: Enable developer tools in Preferences > Advanced, then press Cmd+Option+I",
+        "4. In the developer tools, go to the 'Application' tab (Chrome/Edge) or 'Storage' tab (Firefox)",
+        "5. In the left sidebar, expand 'Cookies' and select 'https://claude.ai'",
+        "6. Locate the cookie named 'sessionKey' and copy its value. Ensure that the value is not URL-encoded.",
+    ]
+)
+
+
+def _skip_to_next_value(buffer, pos, in_array):
+    """
+    Skips whitespace and commas, and the array's opening bracket if it hasn't been read yet.
+
+    Args:
+        buffer (str): The text read so far.
+        pos (int): The position to start at.
+        in_array (bool): Whether the opening bracket has already been read.
+
+    Returns:
+        tuple: The position of the next value, or the end of the buffer, and whether the
+            opening bracket has been read.
+
+    Raises:
+        ProviderError: If the text doesn't start with an array.
+    """
+    while True:
+        while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+            pos += 1
+        if pos == len(buffer) or in_array:
+            return pos, in_array
+        if buffer[pos] != "[":
+            raise ProviderError("Invalid JSON response from API: expected array")
+        in_array = True
+        pos += 1
+
+
+def _decode_array_item(decoder, buffer, pos, more_data):
+    """
+    Decodes the array item that starts at the given position.
+
+    Args:
+        decoder (json.JSONDecoder): The decoder to use.
+        buffer (str): The text read so far.
+        pos (int): The position the item starts at.
+        more_data (bool): Whether the stream may still have more text to read.
+
+    Returns:
+        tuple: The item and the position just past it, or None if more text is needed.
+
+    Raises:
+        ProviderError: If the item is malformed and no more text is coming.
+    """
+    try:
+        item, end = decoder.raw_decode(buffer, pos)
+    except json.JSONDecodeError:
+        if not more_data:
+            raise ProviderError("Invalid JSON response from API")
+        return None  # The item is incomplete, read more data
+    if end == len(buffer) and more_data:
+        return None  # A scalar at the end of the buffer may continue in the next chunk
+    return item, end
+
+
+def _iter_json_array(stream, chunk_size=64 * 1024):
+    """
+    Yields the items of a JSON array read incrementally from a binary stream.
+
+    Args:
+        stream: A file-like object with a read(size) method returning bytes.
+        chunk_size (int): The number of bytes to read at a time.
+
+    Yields:
+        The decoded items of the array, in order.
+
+    Raises:
+        ProviderError: If the stream does not contain a well-formed JSON array.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    in_array = False
+    while True:
+        chunk = stream.read(chunk_size)
+        buffer += text_decoder.decode(chunk, final=not chunk)
+        pos = 0
+        while True:
+            pos, in_array = _skip_to_next_value(buffer, pos, in_array)
+            if pos == len(buffer):
+                break
+            if buffer[pos] == "]":
+                return
+            decoded = _decode_array_item(decoder, buffer, pos, more_data=bool(chunk))
+            if decoded is None:
+                break
+            item, pos = decoded
+            yield item
+        buffer = buffer[pos:]
+        if not chunk:
+            raise ProviderError("Invalid JSON response from API: unterminated array")
+
+
+# How long a fetched chat list is reused before asking the server again, in seconds
+CHAT_CONVERSATIONS_CACHE_TTL = 5
+
+
 def _get_session_key_expiry():
     while True:
         date_format = "%a, %d %b %Y %H:%M:%S %Z"
@@ -46,6 +160,7 @@ class BaseClaudeAIProvider(BaseProvider):
             )  # a provider may not edit the config
         self.logger = logging.getLogger(__name__)
         self._configure_logging()
+        self._chat_conversations_cache = {}
 
     @property
     def base_url(self):
@@ -128,24 +243,7 @@ class BaseClaudeAIProvider(BaseProvider):
         click.echo(
             f"A session key is required to call: {self.config.get('claude_api_url')}"
         )
-        click.echo("To obtain your session key, please follow these steps:")
-        click.echo("1. Open your web browser and go to https://claude.ai")
-        click.echo("2. Log in to your Claude account if you haven't already")
-        click.echo("3. Once logged in, open your browser's developer tools:")
-        click.echo("   - Chrome/Edge: Press F12 or Ctrl+Shift+I (Cmd+Option+I on Mac)")
-        click.echo("   - Firefox: Press F12 or Ctrl+Shift+I (Cmd+Option+I on Mac)")
-        click.echo(
-            "   - Safari: Enable developer tools in Preferences > Advanced, then press Cmd+Option+I"
-        )
-        click.echo(
-            "4. In the developer tools, go to the 'Application' tab (Chrome/Edge) or 'Storage' tab (Firefox)"
-        )
-        click.echo(
-            "5. In the left sidebar, expand 'Cookies' and select 'https://claude.ai'"
-        )
-        click.echo(
-            "6. Locate the cookie named 'sessionKey' and copy its value. Ensure that the value is not URL-encoded."
-        )
+        click.echo(_LOGIN_INSTRUCTIONS)
 
     def _get_valid_session_key(self):
         """Get and validate a session key from user input."""
@@ -235,9 +333,33 @@ class BaseClaudeAIProvider(BaseProvider):
         )
 
     def get_chat_conversations(self, organization_id):
-        return self._make_request(
+        cached = self._chat_conversations_cache.get(organization_id)
+        if cached and time.monotonic() - cached[0] < CHAT_CONVERSATIONS_CACHE_TTL:
+            return cached[1]
+
+        chats = self._make_request(
             "GET", f"/organizations/{organization_id}/chat_conversations"
         )
+        self._chat_conversations_cache[organization_id] = (time.monotonic(), chats)
+        return chats
+
+    def iter_chat_conversations(self, organization_id):
+        """
+        Yields the organization's chats one at a time while the response is still being read.
+
+        Args:
+            organization_id (str): The ID of the organization.
+
+        Yields:
+            dict: The chat conversations, in the order returned by the API.
+        """
+        response = self._make_request_stream(
+            "GET",
+            f"/organizations/{organization_id}/chat_conversations",
+            accept="application/json",
+        )
+        with response:
+            yield from _iter_json_array(response)
 
     def get_published_artifacts(self, organization_id):
         return self._make_request(
@@ -262,7 +384,10 @@ class BaseClaudeAIProvider(BaseProvider):
     def delete_chat(self, organization_id, conversation_uuids):
         endpoint = f"/organizations/{organization_id}/chat_conversations/delete_many"
         data = {"conversation_uuids": conversation_uuids}
-        return self._make_request("POST", endpoint, data)
+        try:
+            return self._make_request("POST", endpoint, data)
+        finally:
+            self._chat_conversations_cache.pop(organization_id, None)
 
     def _make_request(self, method, endpoint, data=None):
         raise NotImplementedError("This method should be implemented by subclasses")
@@ -276,9 +401,12 @@ class BaseClaudeAIProvider(BaseProvider):
         if model is not None:
             data["model"] = model
 
-        return self._make_request(
-            "POST", f"/organizations/{organization_id}/chat_conversations", data
-        )
+        try:
+            return self._make_request(
+                "POST", f"/organizations/{organization_id}/chat_conversations", data
+            )
+        finally:
+            self._chat_conversations_cache.pop(organization_id, None)
 
     def _generate_uuid(self):
         """Generate a UUID for the chat conversation."""
@@ -286,7 +414,9 @@ class BaseClaudeAIProvider(BaseProvider):
 
         return str(uuid.uuid4())
 
-    def _make_request_stream(self, method, endpoint, data=None):
+    def _make_request_stream(
+        self, method, endpoint, data=None, accept="text/event-stream"
+    ):
         # This method should be implemented by subclasses to return a response object
         # that can be used with sseclient
         raise NotImplementedError("This method should be implemented by subclasses")
@@ -49,6 +49,10 @@ class BaseProvider(ABC):
         """Retrieve a list of chat conversations for a specified organization."""
         pass
 
+    def iter_chat_conversations(self, organization_id):
+        """Yield the chat conversations for a specified organization one at a time."""
+        yield from self.get_chat_conversations(organization_id)
+
     @abstractmethod
     def get_published_artifacts(self, organization_id):
         """Retrieve a list of published artifacts for a specified organization."""
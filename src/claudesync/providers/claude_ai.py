@@ -1,3 +1,6 @@
+import http.client
+import select
+import threading
 import urllib.request
 import urllib.error
 import urllib.parse
@@ -7,10 +10,150 @@ from datetime import datetime, timezone
 from .base_claude_ai import BaseClaudeAIProvider
 from ..exceptions import ProviderError
 
+# Methods that can be sent again without risk if the connection drops before the
+# response arrives
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+
 
 class ClaudeAIProvider(BaseClaudeAIProvider):
     def __init__(self, config=None):
         super().__init__(config)
+        # Each thread keeps its own connection open between requests, so a sync doesn't
+        # pay for a new TCP and TLS handshake on every API call
+        self._connections = threading.local()
+
+    def _get_connection(self, scheme, netloc):
+        """
+        Returns this thread's connection to the given host, opening one if needed.
+
+        Args:
+            scheme (str): "https" or "http".
+            netloc (str): The host, with the port if it isn't the default.
+
+        Returns:
+            http.client.HTTPConnection: The connection to send the request on.
+        """
+        connection = getattr(self._connections, "connection", None)
+        if connection is not None and self._connections.key == (scheme, netloc):
+            # An idle connection the server has closed reads as ready, so reconnect
+            # before sending anything on it
+            if (
+                connection.sock is not None
+                and select.select([connection.sock], [], [], 0)[0]
+            ):
+                self._drop_connection(connection)
+            return connection
+        if connection is not None:
+            connection.close()
+        if scheme == "https":
+            connection = http.client.HTTPSConnection(netloc)
+        else:
+            connection = http.client.HTTPConnection(netloc)
+        self._connections.connection = connection
+        self._connections.key = (scheme, netloc)
+        self._connections.used = False
+        return connection
+
+    def _drop_connection(self, connection):
+        """
+        Closes this thread's connection, so the next request opens a new one.
+
+        Args:
+            connection (http.client.HTTPConnection): This thread's connection.
+
+        Returns:
+            bool: Whether the connection had already answered a request.
+        """
+        used = self._connections.used
+        connection.close()
+        self._connections.used = False
+        return used
+
+    def _send(self, connection, method, path, body, headers):
+        """
+        Sends a request on this thread's connection and returns the response.
+
+        A request is sent again on a new connection if a reused connection turns out to
+        be closed, but only when the server can't have acted on it already.
+
+        Args:
+            connection (http.client.HTTPConnection): This thread's connection.
+            method (str): The HTTP method.
+            path (str): The path and query to request.
+            body (bytes): The request body, or None.
+            headers (dict): The request headers.
+
+        Returns:
+            http.client.HTTPResponse: The response.
+        """
+        try:
+            connection.request(method, path, body=body, headers=headers)
+        except ConnectionError:
+            # The request couldn't be written, so the server never saw it
+            if not self._drop_connection(connection):
+                raise
+            connection.request(method, path, body=body, headers=headers)
+        try:
+            response = connection.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionError):
+            # The server may have handled the request before the connection dropped,
+            # so only requests that are safe to repeat are sent again
+            if (
+                not self._drop_connection(connection)
+                or method not in IDEMPOTENT_METHODS
+            ):
+                raise
+            connection.request(method, path, body=body, headers=headers)
+            response = connection.getresponse()
+        self._connections.used = True
+        return response
+
+    def _open(self, method, url, body, headers):
+        """
+        Sends a request and returns its response, reusing this thread's connection.
+
+        Requests that go through a proxy are left to urllib, which knows how to use it,
+        and so are redirects, which urllib follows the same way it always has.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The full URL to request.
+            body (bytes): The request body, or None.
+            headers (dict): The request headers.
+
+        Returns:
+            The response, with the status, headers and read() of a urllib response.
+
+        Raises:
+            urllib.error.HTTPError: If the server doesn't answer with a success status.
+        """
+        req = urllib.request.Request(url, data=body, headers=headers, method=method)
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme in urllib.request.getproxies() and not (
+            urllib.request.proxy_bypass(parts.hostname)
+        ):
+            return urllib.request.urlopen(req)
+
+        path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+        connection = self._get_connection(parts.scheme, parts.netloc)
+        response = self._send(connection, method, path, body, headers)
+
+        if 300 <= response.status < 400 and "Location" in response.headers:
+            response.read()  # Finish the response so the connection can be reused
+            redirect = urllib.request.HTTPRedirectHandler().redirect_request(
+                req,
+                response,
+                response.status,
+                response.reason,
+                response.headers,
+                urllib.parse.urljoin(url, response.headers["Location"]),
+            )
+            return urllib.request.urlopen(redirect)
+        if not 200 <= response.status < 300:
+            raise urllib.error.HTTPError(
+                url, response.status, response.reason, response.headers, response
+            )
+        return response
 
     def _make_request(self, method, endpoint, data=None):
         url = f"{self.base_url}{endpoint}"
@@ -32,22 +175,15 @@ class ClaudeAIProvider(BaseClaudeAIProvider):
             if data:
                 self.logger.debug(f"Request data: {data}")
 
-            # Prepare the request
-            req = urllib.request.Request(url, method=method)
-            for key, value in headers.items():
-                req.add_header(key, value)
-
             # Add cookies
             cookie_string = "; ".join([f"{k}={v}" for k, v in cookies.items()])
-            req.add_header("Cookie", cookie_string)
+            headers["Cookie"] = cookie_string
 
             # Add data if present
-            if data:
-                json_data = json.dumps(data).encode("utf-8")
-                req.data = json_data
+            json_data = json.dumps(data).encode("utf-8") if data else None
 
             # Make the request
-            with urllib.request.urlopen(req) as response:
+            with self._open(method, url, json_data, headers) as response:
                 self.logger.debug(f"Response status code: {response.status}")
                 self.logger.debug(f"Response headers: {response.headers}")
 
@@ -67,7 +203,7 @@ class ClaudeAIProvider(BaseClaudeAIProvider):
 
         except urllib.error.HTTPError as e:
             self.handle_http_error(e)
-        except urllib.error.URLError as e:
+        except (OSError, http.client.HTTPException) as e:
             self.logger.error(f"URL Error: {str(e)}")
             raise ProviderError(f"API request failed: {str(e)}")
         except json.JSONDecodeError as json_err:
@@ -116,13 +252,15 @@ class ClaudeAIProvider(BaseClaudeAIProvider):
             self.logger.error(error_msg)
             raise ProviderError(error_msg)
 
-    def _make_request_stream(self, method, endpoint, data=None):
+    def _make_request_stream(
+        self, method, endpoint, data=None, accept="text/event-stream"
+    ):
         url = f"{self.base_url}{endpoint}"
         session_key, _ = self.config.get_session_key("claude.ai")
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:129.0) Gecko/20100101 Firefox/129.0",
             "Content-Type": "application/json",
-            "Accept": "text/event-stream",
+            "Accept": accept,
             "Cookie": f"sessionKey={session_key}",
         }
 
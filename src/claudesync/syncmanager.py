@@ -42,7 +42,7 @@ def retry_on_403(max_retries=3, delay=1):
 
 
 class SyncManager:
-    def __init__(self, provider, config, local_path):
+    def __init__(self, provider, config, local_path, show_progress=True):
         self.provider = provider
         self.config = config
         self.active_organization_id = config.get("active_organization_id")
@@ -54,6 +54,9 @@ class SyncManager:
         self.retry_delay = 1
         self.compression_algorithm = config.get("compression_algorithm", "none")
         self.synced_files = {}
+        # Progress bars are turned off when several projects sync at the same time,
+        # since their bars would be drawn over each other
+        self.show_progress = show_progress
 
     def sync(self, local_files, remote_files):
         self.synced_files = {}  # Reset synced files at the start of sync
@@ -66,11 +69,17 @@ class SyncManager:
         remote_files_to_delete = set(rf["file_name"] for rf in remote_files)
         synced_files = set()
 
-        with tqdm(total=len(local_files), desc="Local → Remote") as pbar:
+        remote_files_by_name = {}
+        for rf in remote_files:
+            remote_files_by_name.setdefault(rf["file_name"], rf)
+
+        with tqdm(
+            total=len(local_files),
+            desc="Local → Remote",
+            disable=not self.show_progress,
+        ) as pbar:
             for local_file, local_checksum in local_files.items():
-                remote_file = next(
-                    (rf for rf in remote_files if rf["file_name"] == local_file), None
-                )
+                remote_file = remote_files_by_name.get(local_file)
                 if remote_file:
                     self.update_existing_file(
                         local_file,
@@ -86,7 +95,11 @@ class SyncManager:
         self.update_local_timestamps(remote_files, synced_files)
 
         if self.two_way_sync:
-            with tqdm(total=len(remote_files), desc="Local ← Remote") as pbar:
+            with tqdm(
+                total=len(remote_files),
+                desc="Local ← Remote",
+                disable=not self.show_progress,
+            ) as pbar:
                 for remote_file in remote_files:
                     self.sync_remote_to_local(
                         remote_file, remote_files_to_delete, synced_files
@@ -117,15 +130,19 @@ class SyncManager:
         self._cleanup_old_remote_files(remote_files)
 
     def _pack_files(self, local_files):
-        packed_content = io.StringIO()
-        for file_path, file_hash in local_files.items():
+        parts = []
+        for file_path in local_files:
             full_path = os.path.join(self.local_path, file_path)
             with open(full_path, "r", encoding="utf-8") as f:
                 content = f.read()
-            packed_content.write(f"--- BEGIN FILE: {file_path} ---\n")
-            packed_content.write(content)
-            packed_content.write(f"\n--- END FILE: {file_path} ---\n")
-        return packed_content.getvalue()
+            parts.extend(
+                (
+                    f"--- BEGIN FILE: {file_path} ---\n",
+                    content,
+                    f"\n--- END FILE: {file_path} ---\n",
+                )
+            )
+        return "".join(parts)
 
     @retry_on_403()
     def _upload_compressed_file(self, compressed_content, file_name):
@@ -158,7 +175,9 @@ class SyncManager:
         current_file = None
         current_content = io.StringIO()
 
-        for line in packed_content.splitlines():
+        # Iterate over the lines lazily instead of building a list of all of them
+        for line in io.StringIO(packed_content):
+            line = line.rstrip("\n")
             if line.startswith("--- BEGIN FILE:"):
                 if current_file:
                     self._write_file(current_file, current_content.getvalue())
@@ -203,7 +222,12 @@ class SyncManager:
         remote_checksum = compute_md5_hash(remote_content)
         if local_checksum != remote_checksum:
             logger.debug(f"Updating {local_file} on remote...")
-            with tqdm(total=2, desc=f"Updating {local_file}", leave=False) as pbar:
+            with tqdm(
+                total=2,
+                desc=f"Updating {local_file}",
+                leave=False,
+                disable=not self.show_progress,
+            ) as pbar:
                 self.provider.delete_file(
                     self.active_organization_id,
                     self.active_project_id,
@@ -232,7 +256,12 @@ class SyncManager:
             os.path.join(self.local_path, local_file), "r", encoding="utf-8"
         ) as file:
             content = file.read()
-        with tqdm(total=1, desc=f"Uploading {local_file}", leave=False) as pbar:
+        with tqdm(
+            total=1,
+            desc=f"Uploading {local_file}",
+            leave=False,
+            disable=not self.show_progress,
+        ) as pbar:
             self.provider.upload_file(
                 self.active_organization_id, self.active_project_id, local_file, content
             )
@@ -246,30 +275,42 @@ class SyncManager:
                 local_file_path = os.path.join(
                     self.local_path, remote_file["file_name"]
                 )
-                if os.path.exists(local_file_path):
-                    remote_timestamp = datetime.fromisoformat(
-                        remote_file["created_at"].replace("Z", "+00:00")
-                    ).timestamp()
+                remote_timestamp = datetime.fromisoformat(
+                    remote_file["created_at"].replace("Z", "+00:00")
+                ).timestamp()
+                try:
                     os.utime(local_file_path, (remote_timestamp, remote_timestamp))
-                    logger.debug(f"Updated timestamp on local file {local_file_path}")
+                except FileNotFoundError:
+                    continue
+                logger.debug(f"Updated timestamp on local file {local_file_path}")
 
     def sync_remote_to_local(self, remote_file, remote_files_to_delete, synced_files):
         local_file_path = os.path.join(self.local_path, remote_file["file_name"])
-        if os.path.exists(local_file_path):
-            self.update_existing_local_file(
+        try:
+            # A single stat both checks that the file exists and gives its mtime
+            local_stat = os.stat(local_file_path)
+        except FileNotFoundError:
+            self.create_new_local_file(
                 local_file_path, remote_file, remote_files_to_delete, synced_files
             )
         else:
-            self.create_new_local_file(
-                local_file_path, remote_file, remote_files_to_delete, synced_files
+            self.update_existing_local_file(
+                local_file_path,
+                remote_file,
+                remote_files_to_delete,
+                synced_files,
+                local_stat.st_mtime,
             )
 
     def update_existing_local_file(
-        self, local_file_path, remote_file, remote_files_to_delete, synced_files
+        self,
+        local_file_path,
+        remote_file,
+        remote_files_to_delete,
+        synced_files,
+        local_mtime,
     ):
-        local_mtime = datetime.fromtimestamp(
-            os.path.getmtime(local_file_path), tz=timezone.utc
-        )
+        local_mtime = datetime.fromtimestamp(local_mtime, tz=timezone.utc)
         remote_mtime = datetime.fromisoformat(
             remote_file["created_at"].replace("Z", "+00:00")
         )
@@ -292,7 +333,10 @@ class SyncManager:
         )
         content = remote_file["content"]
         with tqdm(
-            total=1, desc=f"Creating {remote_file['file_name']}", leave=False
+            total=1,
+            desc=f"Creating {remote_file['file_name']}",
+            leave=False,
+            disable=not self.show_progress,
         ) as pbar:
             with open(local_file_path, "w", encoding="utf-8") as file:
                 file.write(content)
@@ -306,16 +350,24 @@ class SyncManager:
             logger.info("Remote pruning is not enabled.")
             return
 
+        # Look each file up by name once instead of scanning the remote list per deletion
+        remote_files_by_name = {}
+        for rf in remote_files:
+            remote_files_by_name.setdefault(rf["file_name"], rf)
         for file_to_delete in list(remote_files_to_delete):
-            self.delete_remote_files(file_to_delete, remote_files)
+            self.delete_remote_files(
+                file_to_delete, remote_files_by_name[file_to_delete]
+            )
 
     @retry_on_403()
-    def delete_remote_files(self, file_to_delete, remote_files):
+    def delete_remote_files(self, file_to_delete, remote_file):
         logger.debug(f"Deleting {file_to_delete} from remote...")
-        remote_file = next(
-            rf for rf in remote_files if rf["file_name"] == file_to_delete
-        )
-        with tqdm(total=1, desc=f"Deleting {file_to_delete}", leave=False) as pbar:
+        with tqdm(
+            total=1,
+            desc=f"Deleting {file_to_delete}",
+            leave=False,
+            disable=not self.show_progress,
+        ) as pbar:
             self.provider.delete_file(
                 self.active_organization_id, self.active_project_id, remote_file["uuid"]
             )
@@ -1,17 +1,35 @@
 import os
 import hashlib
-from functools import wraps
+import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 import click
-import pathspec
 import logging
 
-from claudesync.exceptions import ConfigurationError, ProviderError
-from claudesync.provider_factory import get_provider
+from claudesync.exceptions import ConfigurationError
 
 logger = logging.getLogger(__name__)
 
+# Below this many files, hashing them one by one is faster than starting a thread pool
+PARALLEL_PROCESS_THRESHOLD = 16
+PROCESS_FILE_WORKERS = 8
+
+# Directories that are never synced, such as version control metadata
+EXCLUDED_DIRS = frozenset(
+    {
+        ".git",
+        ".svn",
+        ".hg",
+        ".bzr",
+        "_darcs",
+        "CVS",
+        "claude_chats",
+        ".claudesync",
+    }
+)
+
 
 def normalize_and_calculate_md5(content):
     """
@@ -49,33 +67,38 @@ def load_gitignore(base_path):
                                     if the file exists; otherwise, None.
     """
     gitignore_path = os.path.join(base_path, ".gitignore")
-    if os.path.exists(gitignore_path):
+    # Open the file directly rather than checking that it exists first
+    try:
         with open(gitignore_path, "r") as f:
-            return pathspec.PathSpec.from_lines("gitwildmatch", f)
-    return None
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return None
 
+    import pathspec
 
-def is_text_file(file_path, sample_size=8192):
+    return pathspec.PathSpec.from_lines("gitwildmatch", lines)
+
+
+def write_json_atomic(path, data, indent=None):
     """
-    Determines if a file is a text file by checking for the absence of null bytes.
+    Writes data to a JSON file atomically.
 
-    This function reads a sample of the file (default 8192 bytes) and checks if it contains
-    any null byte (\x00). The presence of a null byte is often indicative of a binary file.
-    This is a heuristic method and may not be 100% accurate for all file types.
+    The JSON is written to a temporary file next to the target, which then replaces it,
+    so an interrupted write never leaves a truncated file behind.
 
     Args:
-        file_path (str): The path to the file to be checked.
-        sample_size (int, optional): The number of bytes to read from the file for checking.
-                                     Defaults to 8192.
-
-    Returns:
-        bool: True if the file is likely a text file, False if it is likely binary or an error occurred.
+        path (Path): The file to write.
+        data: The JSON-serializable data to write.
+        indent (int, optional): The indentation passed to json.dump. Defaults to None.
     """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
     try:
-        with open(file_path, "rb") as file:
-            return b"\x00" not in file.read(sample_size)
-    except IOError:
-        return False
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=indent)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def compute_md5_hash(content):
@@ -95,18 +118,17 @@ def compute_md5_hash(content):
     return hashlib.md5(content.encode("utf-8")).hexdigest()
 
 
-def should_process_file(
-    config_manager, file_path, filename, gitignore, base_path, claudeignore
-):
+def should_process_file(file_path, filename, gitignore, base_path, claudeignore):
     """
     Determines whether a file should be processed based on various criteria.
 
     This function checks if a file should be included in the synchronization process by applying
     several filters:
-    - Checks if the file size is within the configured maximum limit.
     - Skips temporary editor files (ending with '~').
     - Applies .gitignore rules if a gitignore PathSpec is provided.
-    - Verifies if the file is a text file.
+
+    The size limit and whether the file is text are checked by process_file, which reads
+    the file anyway, so no separate stat call is needed here.
 
     Args:
         file_path (str): The full path to the file.
@@ -118,11 +140,6 @@ def should_process_file(
     Returns:
         bool: True if the file should be processed, False otherwise.
     """
-    # Check file size
-    max_file_size = config_manager.get("max_file_size", 32 * 1024)
-    if os.path.getsize(file_path) > max_file_size:
-        return False
-
     # Skip temporary editor files
     if filename.endswith("~"):
         return False
@@ -137,28 +154,38 @@ def should_process_file(
     if claudeignore and claudeignore.match_file(rel_path):
         return False
 
-    # Check if it's a text file
-    return is_text_file(file_path)
+    return True
 
 
-def process_file(file_path):
+def process_file(file_path, sample_size=8192, max_file_size=32 * 1024):
     """
-    Reads the content of a file and computes its MD5 hash.
+    Reads the content of a text file and computes its MD5 hash.
 
-    This function attempts to read the file as UTF-8 text and compute its MD5 hash.
-    If the file cannot be read as UTF-8 or any other error occurs, it logs the issue
-    and returns None.
+    The file is read once, stopping one byte past `max_file_size` to detect files that
+    are too large. A null byte within the first `sample_size` bytes marks the file as
+    binary. The content must be valid UTF-8 and is hashed with line endings normalized
+    the same way as reading it in text mode. If the file is binary, too large, cannot be decoded or any
+    other error occurs, it logs the issue and returns None.
 
     Args:
         file_path (str): The path to the file to be processed.
+        sample_size (int, optional): The number of bytes checked for a null byte.
+                                     Defaults to 8192.
+        max_file_size (int, optional): The maximum file size in bytes. Defaults to 32 KiB.
 
     Returns:
         str or None: The MD5 hash of the file's content if successful, None otherwise.
     """
     try:
-        with open(file_path, "r", encoding="utf-8") as file:
-            content = file.read()
-            return compute_md5_hash(content)
+        with open(file_path, "rb") as file:
+            data = file.read(max_file_size + 1)
+        if len(data) > max_file_size or data.find(b"\x00", 0, sample_size) != -1:
+            return None
+        # Validate the bytes as UTF-8 but hash them directly instead of re-encoding
+        # the decoded text; CR and LF never occur inside multi-byte sequences
+        data.decode("utf-8")
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        return hashlib.md5(data).hexdigest()
     except UnicodeDecodeError:
         logger.debug(f"Unable to read {file_path} as UTF-8 text. Skipping.")
     except Exception as e:
@@ -182,16 +209,7 @@ def get_local_files(config, local_path, category=None, include_submodules=False)
     gitignore = load_gitignore(local_path)
     claudeignore = load_claudeignore(local_path)
     files = {}
-    exclude_dirs = {
-        ".git",
-        ".svn",
-        ".hg",
-        ".bzr",
-        "_darcs",
-        "CVS",
-        "claude_chats",
-        ".claudesync",
-    }
+    candidates = []
 
     categories = config.get("file_categories", {})
     if category and category not in categories:
@@ -201,10 +219,12 @@ def get_local_files(config, local_path, category=None, include_submodules=False)
     if category:
         patterns = categories[category]["patterns"]
 
+    import pathspec
+
     spec = pathspec.PathSpec.from_lines("gitwildmatch", patterns)
 
     submodules = config.get("submodules", [])
-    submodule_paths = [sm["relative_path"] for sm in submodules]
+    submodule_paths = {sm["relative_path"] for sm in submodules}
 
     for root, dirs, filenames in os.walk(local_path, topdown=True):
         rel_root = os.path.relpath(root, local_path)
@@ -219,7 +239,7 @@ def get_local_files(config, local_path, category=None, include_submodules=False)
         dirs[:] = [
             d
             for d in dirs
-            if d not in exclude_dirs
+            if d not in EXCLUDED_DIRS
             and not (gitignore and gitignore.match_file(os.path.join(rel_root, d)))
             and not (
                 claudeignore and claudeignore.match_file(os.path.join(rel_root, d))
@@ -231,42 +251,27 @@ def get_local_files(config, local_path, category=None, include_submodules=False)
             full_path = os.path.join(root, filename)
 
             if spec.match_file(rel_path) and should_process_file(
-                config, full_path, filename, gitignore, local_path, claudeignore
+                full_path, filename, gitignore, local_path, claudeignore
             ):
-                file_hash = process_file(full_path)
-                if file_hash:
-                    files[rel_path] = file_hash
+                candidates.append((rel_path, full_path))
+
+    # Reading and hashing is I/O bound, so larger trees are processed on a thread pool
+    max_file_size = config.get("max_file_size", 32 * 1024)
+    full_paths = [full_path for _, full_path in candidates]
+    process = partial(process_file, max_file_size=max_file_size)
+    if len(candidates) < PARALLEL_PROCESS_THRESHOLD:
+        file_hashes = map(process, full_paths)
+    else:
+        with ThreadPoolExecutor(max_workers=PROCESS_FILE_WORKERS) as executor:
+            file_hashes = list(executor.map(process, full_paths))
+
+    for (rel_path, _), file_hash in zip(candidates, file_hashes):
+        if file_hash:
+            files[rel_path] = file_hash
 
     return files
 
 
-def handle_errors(func):
-    """
-    A decorator that wraps a function to catch and handle specific exceptions.
-
-    This decorator catches exceptions of type ConfigurationError and ProviderError
-    that are raised within the decorated function. When such an exception is caught,
-    it prints an error message to the console using click's echo function. This is
-    useful for CLI applications where a friendly error message is preferred over a
-    full traceback for known error conditions.
-
-    Args:
-        func (Callable): The function to be decorated.
-
-    Returns:
-        Callable: The wrapper function that includes exception handling.
-    """
-
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        try:
-            return func(*args, **kwargs)
-        except (ConfigurationError, ProviderError) as e:
-            click.echo(f"Error: {str(e)}")
-
-    return wrapper
-
-
 def validate_and_get_provider(config, require_org=True, require_project=False):
     """
     Validates the configuration for the presence of an active provider and session key,
@@ -281,7 +286,8 @@ def validate_and_get_provider(config, require_org=True, require_project=False):
                                           is required. Defaults to False.
 
     Returns:
-        object: An instance of the provider specified in the configuration.
+        object: An instance of the provider specified in the configuration. Within a
+                click invocation the same instance is returned on every call.
 
     Raises:
         ConfigurationError: If the active provider or session key is missing, or if
@@ -289,6 +295,8 @@ def validate_and_get_provider(config, require_org=True, require_project=False):
                             or if require_project is True and no active project ID is set.
         ProviderError: If the session key has expired.
     """
+    from claudesync.provider_factory import get_provider
+
     if require_org and not config.get("active_organization_id"):
         raise ConfigurationError(
             "No active organization set. Please select an organization (claudesync organization set)."
@@ -311,7 +319,14 @@ def validate_and_get_provider(config, require_org=True, require_project=False):
             f"No valid session key found for {active_provider}. Please log in again."
         )
 
-    return get_provider(config, active_provider)
+    # Reuse the provider built earlier in the same CLI invocation, so that state such as
+    # its cached chat list is shared by every command and helper that asks for it
+    ctx = click.get_current_context(silent=True)
+    providers = ctx.meta.setdefault("claudesync.providers", {}) if ctx else {}
+    provider = providers.get(active_provider)
+    if provider is None or provider.config is not config:
+        provider = providers[active_provider] = get_provider(config, active_provider)
+    return provider
 
 
 def validate_and_store_local_path(config):
@@ -364,10 +379,15 @@ def load_claudeignore(base_path):
                                     if the file exists; otherwise, None.
     """
     claudeignore_path = os.path.join(base_path, ".claudeignore")
-    if os.path.exists(claudeignore_path):
+    try:
         with open(claudeignore_path, "r") as f:
-            return pathspec.PathSpec.from_lines("gitwildmatch", f)
-    return None
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return None
+
+    import pathspec
+
+    return pathspec.PathSpec.from_lines("gitwildmatch", lines)
 
 
 def detect_submodules(base_path, submodule_detect_filenames):
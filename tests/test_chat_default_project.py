@@ -0,0 +1,40 @@
+import os
+import unittest
+
+from claudesync.cli.chat import get_default_project
+from claudesync.configmanager import InMemoryConfigManager
+
+
+class TestGetDefaultProject(unittest.TestCase):
+    def setUp(self):
+        self.local_path = os.path.abspath(os.path.join(os.sep, "work", "app"))
+        self.config = InMemoryConfigManager()
+        self.config.set("local_path", self.local_path, local=True)
+        self.projects = [
+            {"id": "proj1", "name": "App"},
+            {"id": "sub1", "name": "App-SubModule-api"},
+            {"id": "sub2", "name": "App-SubModule-api/v2"},
+        ]
+
+    def default_for(self, *parts):
+        current_dir = os.path.join(self.local_path, *parts)
+        return get_default_project(
+            self.config, "proj1", "App", current_dir, self.projects
+        )
+
+    def test_matches_active_project(self):
+        self.assertEqual(self.default_for("src"), 0)
+
+    def test_prefers_deepest_submodule(self):
+        self.assertEqual(self.default_for("services", "api"), 1)
+        self.assertEqual(self.default_for("services", "api", "v2", "handlers"), 2)
+
+    def test_does_not_match_sibling_with_common_prefix(self):
+        current_dir = self.local_path + "-old"
+        self.assertIsNone(
+            get_default_project(self.config, "proj1", "App", current_dir, self.projects)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
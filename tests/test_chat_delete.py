@@ -0,0 +1,96 @@
+import threading
+import unittest
+from unittest.mock import patch
+
+from claudesync.cli.chat import delete_all_chats, parse_chat_selection
+from claudesync.exceptions import ProviderError
+
+
+class FakeChatProvider:
+    def __init__(self, count, failing=False, max_batch=None, stuck=()):
+        self.chats = [{"uuid": f"chat-{i}"} for i in range(count)]
+        self.failing = failing
+        self.stuck = set(stuck)
+        self.max_batch = max_batch
+        self.delete_calls = []
+        self.lock = threading.Lock()
+
+    def get_chat_conversations(self, organization_id):
+        return list(self.chats)
+
+    def delete_chat(self, organization_id, conversation_uuids):
+        if self.failing:
+            raise ProviderError("delete failed")
+        if self.max_batch and len(conversation_uuids) > self.max_batch:
+            raise ProviderError("too many conversations")
+        if self.stuck.intersection(conversation_uuids):
+            raise ProviderError("chat can't be deleted")
+        with self.lock:
+            self.delete_calls.append(list(conversation_uuids))
+            self.chats = [
+                chat for chat in self.chats if chat["uuid"] not in conversation_uuids
+            ]
+        return conversation_uuids
+
+
+@patch("click.confirm", return_value=True)
+class TestDeleteAllChats(unittest.TestCase):
+    def test_deletes_all_chats_in_one_batch(self, _):
+        provider = FakeChatProvider(120)
+        delete_all_chats(provider, "org1")
+        self.assertEqual(provider.chats, [])
+        self.assertEqual(len(provider.delete_calls), 1)
+
+    def test_falls_back_to_smaller_batches(self, _):
+        provider = FakeChatProvider(120, max_batch=50)
+        delete_all_chats(provider, "org1", parallel=4)
+        self.assertEqual(provider.chats, [])
+        self.assertEqual(
+            sorted(len(batch) for batch in provider.delete_calls), [20, 50, 50]
+        )
+
+    def test_falls_back_to_one_request_per_chat(self, _):
+        provider = FakeChatProvider(5, max_batch=1)
+        delete_all_chats(provider, "org1")
+        self.assertEqual(provider.chats, [])
+        self.assertEqual(len(provider.delete_calls), 5)
+
+    def test_stops_when_nothing_is_deleted(self, _):
+        provider = FakeChatProvider(10, failing=True)
+        delete_all_chats(provider, "org1")
+        self.assertEqual(len(provider.chats), 10)
+
+    def test_only_chats_failing_on_their_own_are_reported(self, _):
+        provider = FakeChatProvider(120, max_batch=50, stuck=["chat-7"])
+        with patch("click.echo") as echo:
+            delete_all_chats(provider, "org1", parallel=4)
+        self.assertEqual(provider.chats, [{"uuid": "chat-7"}])
+        messages = [call.args[0] for call in echo.call_args_list]
+        self.assertEqual(
+            [message for message in messages if message.startswith("Error")],
+            ["Error occurred while deleting chats: chat can't be deleted"],
+        )
+        self.assertIn("Chat deletion complete. Total chats deleted: 119", messages)
+        self.assertIn("Failed to delete 1 chat.", messages)
+
+    def test_declined_prompt_deletes_nothing(self, confirm):
+        confirm.return_value = False
+        provider = FakeChatProvider(10)
+        delete_all_chats(provider, "org1")
+        self.assertEqual(len(provider.chats), 10)
+        self.assertEqual(provider.delete_calls, [])
+
+
+class TestParseChatSelection(unittest.TestCase):
+    def test_numbers_and_ranges(self):
+        self.assertEqual(parse_chat_selection("1, 3,5-7,6", 8), [1, 3, 5, 6, 7])
+
+    def test_out_of_range(self):
+        with self.assertRaises(ValueError):
+            parse_chat_selection("2-9", 8)
+        with self.assertRaises(ValueError):
+            parse_chat_selection("x", 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
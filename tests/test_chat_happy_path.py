@@ -69,6 +69,12 @@ class TestChatHappyPath(unittest.TestCase):
         self.assertIn("Hello there.", result.output)
         self.assertIn("I apologize for the confusion. You're right.", result.output)
 
+        # Step 5: List chats
+        result = self.runner.invoke(cli, ["chat", "ls"], obj=self.config)
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn("UUID: chat1, Name: Test Chat 1, Project: ,", result.output)
+        self.assertIn("UUID: chat2, Name: Test Chat 2", result.output)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,10 +1,14 @@
+import io
+import json
 import unittest
 import threading
 import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import patch
 from datetime import datetime
 
 from claudesync.configmanager import InMemoryConfigManager
+from claudesync.providers.base_claude_ai import _iter_json_array
 from claudesync.providers.claude_ai import ClaudeAIProvider
 from claudesync.exceptions import ProviderError
 from mock_http_server import run_mock_server
@@ -140,6 +144,32 @@ class TestClaudeAIProvider(unittest.TestCase):
         self.assertEqual(chats[0]["uuid"], "chat1")
         self.assertEqual(chats[0]["name"], "Test Chat 1")
 
+    def test_get_chat_conversations_is_cached_until_delete(self):
+        with patch.object(
+            self.provider, "_make_request", return_value=[{"uuid": "chat1"}]
+        ) as make_request:
+            self.provider.get_chat_conversations("org1")
+            self.provider.get_chat_conversations("org1")
+            self.assertEqual(make_request.call_count, 1)
+
+            self.provider.delete_chat("org1", ["chat1"])
+            self.provider.get_chat_conversations("org1")
+            self.assertEqual(make_request.call_count, 3)
+
+    def test_iter_chat_conversations(self):
+        chats = list(self.provider.iter_chat_conversations("org1"))
+        self.assertEqual([chat["uuid"] for chat in chats], ["chat1", "chat2"])
+
+    def test_iter_json_array_across_small_chunks(self):
+        data = json.dumps([{"uuid": "chat1", "name": "Chät 1"}, 12, {"uuid": "c2"}])
+        items = list(_iter_json_array(io.BytesIO(data.encode("utf-8")), chunk_size=3))
+        self.assertEqual(
+            items, [{"uuid": "chat1", "name": "Chät 1"}, 12, {"uuid": "c2"}]
+        )
+
+        with self.assertRaises(ProviderError):
+            list(_iter_json_array(io.BytesIO(b'[{"uuid": "chat1"}'), chunk_size=4))
+
     def test_get_chat_conversation(self):
         chat = self.provider.get_chat_conversation("org1", "chat1")
         self.assertEqual(chat["uuid"], "chat1")
@@ -160,5 +190,108 @@ class TestClaudeAIProvider(unittest.TestCase):
         self.assertIn("403 Forbidden error", str(context.exception))
 
 
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = 0
+    requests = []
+
+    def setup(self):
+        type(self).connections += 1
+        super().setup()
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.handle_request()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.handle_request()
+
+    def handle_request(self):
+        self.requests.append((self.command, self.path))
+        if self.path.endswith("/drop") or (
+            self.path.endswith("/drop-once")
+            and self.requests.count((self.command, self.path)) == 1
+        ):
+            # Read the request, then drop the connection without answering
+            self.close_connection = True
+            return
+        if self.path.endswith("/moved"):
+            self.send_response(302)
+            self.send_header("Location", "/api/organizations")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = json.dumps(
+            [{"uuid": "org1", "name": "Org 1", "capabilities": ["chat", "claude_pro"]}]
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        # Close the connection without telling the client, like a server dropping an
+        # idle keep-alive connection
+        self.close_connection = self.path.endswith("/close")
+
+
+class TestClaudeAIProviderConnections(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever)
+        cls.server_thread.daemon = True
+        cls.server_thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        KeepAliveHandler.connections = 0
+        KeepAliveHandler.requests = []
+        self.config = InMemoryConfigManager()
+        self.config.set(
+            "claude_api_url", f"http://127.0.0.1:{self.server.server_port}/api"
+        )
+        self.provider = ClaudeAIProvider(self.config)
+
+    def test_requests_share_connection(self):
+        for _ in range(3):
+            organizations = self.provider.get_organizations()
+        self.assertEqual(organizations, [{"id": "org1", "name": "Org 1"}])
+        self.assertEqual(KeepAliveHandler.connections, 1)
+
+    def test_request_after_server_closed_idle_connection(self):
+        self.provider._make_request("GET", "/close")
+        time.sleep(0.2)  # Give the server time to close the connection
+        result = self.provider._make_request("POST", "/organizations", {"a": 1})
+        self.assertEqual(result[0]["uuid"], "org1")
+        self.assertEqual(KeepAliveHandler.connections, 2)
+        self.assertEqual(
+            KeepAliveHandler.requests.count(("POST", "/api/organizations")), 1
+        )
+
+    def test_get_is_resent_when_connection_drops(self):
+        self.provider.get_organizations()
+        result = self.provider._make_request("GET", "/drop-once")
+        self.assertEqual(result[0]["uuid"], "org1")
+        self.assertEqual(KeepAliveHandler.requests.count(("GET", "/api/drop-once")), 2)
+
+    def test_post_is_not_resent_when_connection_drops(self):
+        self.provider.get_organizations()
+        with self.assertRaises(ProviderError):
+            self.provider._make_request("POST", "/drop", {"a": 1})
+        self.assertEqual(KeepAliveHandler.requests.count(("POST", "/api/drop")), 1)
+
+    def test_redirect_is_followed(self):
+        result = self.provider._make_request("GET", "/moved")
+        self.assertEqual(result[0]["uuid"], "org1")
+        self.assertEqual(KeepAliveHandler.requests[-1], ("GET", "/api/organizations"))
+
+
 if __name__ == "__main__":
     unittest.main()
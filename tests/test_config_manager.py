@@ -0,0 +1,95 @@
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from claudesync.configmanager import FileConfigManager, InMemoryConfigManager
+
+
+class TestFileConfigManager(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.home = os.path.join(self.temp_dir.name, "home")
+        self.project = os.path.join(self.temp_dir.name, "project")
+        os.makedirs(self.home)
+        os.makedirs(self.project)
+        self.home_patch = patch.dict(os.environ, {"HOME": self.home})
+        self.home_patch.start()
+        self.cwd = os.getcwd()
+        os.chdir(self.project)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.home_patch.stop()
+        self.temp_dir.cleanup()
+
+    def test_set_many_saves_local_config_once(self):
+        config = FileConfigManager()
+        with patch.object(
+            config, "_save_local_config", wraps=config._save_local_config
+        ) as save:
+            config.set_many(
+                {
+                    "local_path": self.project,
+                    "active_project_id": "proj1",
+                    "active_project_name": "Project 1",
+                },
+                local=True,
+            )
+        self.assertEqual(save.call_count, 1)
+
+        local_config_file = os.path.join(
+            self.project, ".claudesync", "config.local.json"
+        )
+        with open(local_config_file) as f:
+            saved = json.load(f)
+        self.assertEqual(saved["active_project_id"], "proj1")
+        self.assertEqual(saved["active_project_name"], "Project 1")
+
+    @patch("claudesync.configmanager.file_config_manager.SessionKeyManager")
+    def test_session_key_is_decrypted_once(self, session_key_manager):
+        manager = session_key_manager.return_value
+        manager.encrypt_session_key.return_value = ("encrypted", "symmetric")
+        manager.decrypt_session_key.return_value = "sk-ant-1234"
+        expiry = datetime(2099, 9, 26, 17, 7, 53)
+
+        config = FileConfigManager()
+        config.set_session_key("claude.ai", "sk-ant-1234", expiry)
+        self.assertEqual(config.get_session_key("claude.ai"), ("sk-ant-1234", expiry))
+        self.assertEqual(config.get_session_key("claude.ai"), ("sk-ant-1234", expiry))
+        self.assertEqual(manager.decrypt_session_key.call_count, 1)
+
+        config.clear_all_session_keys()
+        self.assertEqual(config.get_session_key("claude.ai"), (None, None))
+
+    def test_set_many_global(self):
+        config = FileConfigManager()
+        config.set_many({"upload_delay": 1.5, "two_way_sync": True})
+        self.assertEqual(FileConfigManager().get("upload_delay"), 1.5)
+        self.assertTrue(FileConfigManager().get("two_way_sync"))
+
+    def test_failed_save_keeps_previous_config(self):
+        config = FileConfigManager()
+        config.set("upload_delay", 1.5)
+        with self.assertRaises(TypeError):
+            config.set("upload_delay", object())
+
+        self.assertEqual(FileConfigManager().get("upload_delay"), 1.5)
+        self.assertEqual(
+            os.listdir(os.path.join(self.home, ".claudesync")), ["config.json"]
+        )
+
+
+class TestInMemoryConfigManager(unittest.TestCase):
+    def test_set_many(self):
+        config = InMemoryConfigManager()
+        config.set_many({"active_project_id": "proj1"}, local=True)
+        config.set_many({"upload_delay": 2})
+        self.assertEqual(config.local_config, {"active_project_id": "proj1"})
+        self.assertEqual(config.get("upload_delay"), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import sys
+import unittest
+
+import click
+from click.testing import CliRunner
+
+from claudesync.cli.lazy_group import LazyGroup
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={"chat": "claudesync.cli.chat.chat"},
+)
+def lazy_cli():
+    pass
+
+
+class TestLazyGroup(unittest.TestCase):
+    def test_lists_lazy_subcommands(self):
+        ctx = click.Context(lazy_cli)
+        self.assertIn("chat", lazy_cli.list_commands(ctx))
+
+    def test_resolves_subcommand_on_lookup(self):
+        sys.modules.pop("claudesync.cli.chat", None)
+        ctx = click.Context(lazy_cli)
+        command = lazy_cli.get_command(ctx, "chat")
+        self.assertEqual(command.name, "chat")
+        self.assertIn("claudesync.cli.chat", sys.modules)
+
+    def test_invokes_lazy_subcommand(self):
+        result = CliRunner().invoke(lazy_cli, ["chat", "--help"])
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn("Manage and synchronize chats.", result.output)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+import logging
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from click.testing import CliRunner
+
+from claudesync.cli.main import _get_sync_concurrency, cli
+from claudesync.configmanager import InMemoryConfigManager
+from claudesync.exceptions import ConfigurationError, ProviderError
+
+
+class TestConfigureLogging(unittest.TestCase):
+    def setUp(self):
+        self.config = InMemoryConfigManager()
+        self.logger = logging.getLogger("claudesync")
+        self.addCleanup(self.logger.setLevel, self.logger.level)
+
+    def test_log_level_is_case_insensitive(self):
+        self.config.set("log_level", "debug")
+        result = CliRunner().invoke(
+            cli, ["config", "set", "log_level", "DEBUG"], obj=self.config
+        )
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(self.logger.level, logging.DEBUG)
+
+    def test_unknown_log_level_falls_back_to_info(self):
+        self.config.set("log_level", "chatty")
+        result = CliRunner().invoke(
+            cli, ["config", "set", "log_level", "INFO"], obj=self.config
+        )
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(self.logger.level, logging.INFO)
+        self.assertEqual(self.config.get("log_level"), "INFO")
+
+
+class TestSyncConcurrency(unittest.TestCase):
+    def test_invalid_setting_is_reported(self):
+        config = InMemoryConfigManager()
+        for value in (0, -2, "many", 1.5):
+            config.set("sync_concurrency", value)
+            with self.assertRaises(ConfigurationError):
+                _get_sync_concurrency(config)
+
+    def test_setting_is_used(self):
+        config = InMemoryConfigManager()
+        config.set("sync_concurrency", 2)
+        self.assertEqual(_get_sync_concurrency(config), 2)
+
+
+class TestPush(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.local_path = os.path.realpath(temp_dir.name)
+        for name in ("a", "b"):
+            os.mkdir(os.path.join(self.local_path, name))
+        cwd = os.getcwd()
+        os.chdir(self.local_path)
+        self.addCleanup(os.chdir, cwd)
+
+        self.config = InMemoryConfigManager()
+        self.config.get_local_path = lambda: self.local_path
+        self.config.set("active_provider", "claude.ai")
+        self.config.set("active_organization_id", "org1")
+        self.config.set("active_project_id", "proj1")
+        self.config.set("active_project_name", "Main")
+        self.config.set(
+            "submodules",
+            [
+                {
+                    "relative_path": name,
+                    "active_organization_id": "org1",
+                    "active_project_id": f"proj-{name}",
+                    "active_project_name": name,
+                }
+                for name in ("a", "b")
+            ],
+        )
+
+        self.provider = MagicMock()
+        self.provider.list_files.return_value = []
+        self.events = []
+        self.show_progress = []
+        self.lock = threading.Lock()
+
+    def fake_sync_manager(self, provider, config, local_path, show_progress=True):
+        name = os.path.relpath(local_path, self.local_path)
+        self.show_progress.append(show_progress)
+
+        def sync(local_files, remote_files):
+            with self.lock:
+                self.events.append(("start", name))
+            time.sleep(0.1)
+            with self.lock:
+                self.events.append(("end", name))
+
+        sync_manager = MagicMock()
+        sync_manager.sync.side_effect = sync
+        return sync_manager
+
+    def push(self, *args):
+        with (
+            patch(
+                "claudesync.cli.main.validate_and_get_provider",
+                return_value=self.provider,
+            ),
+            patch(
+                "claudesync.syncmanager.SyncManager", side_effect=self.fake_sync_manager
+            ),
+        ):
+            return CliRunner().invoke(cli, ["push", *args], obj=self.config)
+
+    def test_all_projects_are_synced(self):
+        result = self.push("--parallel", "3")
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn("Main project 'Main' synced successfully", result.output)
+        self.assertIn("Submodule 'a' synced successfully", result.output)
+        self.assertIn("Submodule 'b' synced successfully", result.output)
+        self.assertEqual(
+            sorted(name for event, name in self.events if event == "end"),
+            [".", "a", "b"],
+        )
+        self.assertEqual(self.show_progress, [False, False, False])
+
+    def test_progress_is_shown_when_syncing_one_at_a_time(self):
+        result = self.push("--parallel", "1")
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(self.show_progress, [True, True, True])
+
+    def test_main_project_finishes_first_with_uberproject(self):
+        result = self.push("--uberproject", "--parallel", "3")
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(self.events[:2], [("start", "."), ("end", ".")])
+
+    def test_main_project_finishes_first_with_two_way_sync(self):
+        self.config.set("two_way_sync", True)
+        result = self.push("--parallel", "3")
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(self.events[:2], [("start", "."), ("end", ".")])
+
+    def test_failed_submodule_is_reported(self):
+        def list_files(organization_id, project_id):
+            if project_id == "proj-a":
+                raise ProviderError("boom")
+            return []
+
+        self.provider.list_files.side_effect = list_files
+        result = self.push("--parallel", "3")
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn("Error: Failed to sync 'a': boom", result.output)
+        self.assertIn("Submodule 'b' synced successfully", result.output)
+        self.assertIn("1 of 3 projects failed to sync.", result.output)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+
+from claudesync.session_key_manager import SessionKeyManager
+
+
+class TestSessionKeyManagerKeyType(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def key_manager_for(self, private_key):
+        key_path = os.path.join(self.temp_dir.name, "id_test")
+        with open(key_path, "wb") as f:
+            f.write(
+                private_key.private_bytes(
+                    serialization.Encoding.PEM,
+                    serialization.PrivateFormat.OpenSSH,
+                    serialization.NoEncryption(),
+                )
+            )
+        with patch.object(SessionKeyManager, "_find_ssh_key", return_value=key_path):
+            return SessionKeyManager()
+
+    @patch("claudesync.session_key_manager.subprocess.run")
+    def test_reads_openssh_key_type_without_ssh_keygen(self, run):
+        manager = self.key_manager_for(ed25519.Ed25519PrivateKey.generate())
+        self.assertEqual(manager._get_key_type(), "ed25519")
+
+        manager = self.key_manager_for(ec.generate_private_key(ec.SECP256R1()))
+        self.assertEqual(manager._get_key_type(), "ecdsa")
+        run.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
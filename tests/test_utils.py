@@ -0,0 +1,80 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+import click
+
+from claudesync.configmanager import InMemoryConfigManager
+from claudesync.utils import (
+    compute_md5_hash,
+    get_local_files,
+    validate_and_get_provider,
+)
+
+
+class TestGetLocalFiles(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.local_path = self.temp_dir.name
+        self.config = InMemoryConfigManager()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write(self, name, data):
+        with open(os.path.join(self.local_path, name), "wb") as f:
+            f.write(data)
+
+    def test_hashes_text_files_with_normalized_line_endings(self):
+        self.write("unix.txt", "héllo\nworld\n".encode("utf-8"))
+        self.write("windows.txt", b"hello\r\nworld\r\n")
+
+        files = get_local_files(self.config, self.local_path)
+
+        self.assertEqual(files["unix.txt"], compute_md5_hash("héllo\nworld\n"))
+        self.assertEqual(files["windows.txt"], compute_md5_hash("hello\nworld\n"))
+
+    def test_hashes_many_files(self):
+        for i in range(40):
+            self.write(f"file{i}.txt", f"content {i}".encode("utf-8"))
+
+        files = get_local_files(self.config, self.local_path)
+
+        self.assertEqual(len(files), 40)
+        self.assertEqual(files["file7.txt"], compute_md5_hash("content 7"))
+
+    def test_skips_files_over_max_size(self):
+        self.config.set("max_file_size", 10)
+        self.write("small.txt", b"0123456789")
+        self.write("large.txt", b"0123456789a")
+
+        self.assertEqual(
+            list(get_local_files(self.config, self.local_path)), ["small.txt"]
+        )
+
+    def test_skips_binary_and_non_utf8_files(self):
+        self.write("image.png", b"\x89PNG\x00\x00")
+        self.write("latin1.txt", "café".encode("latin-1"))
+
+        self.assertEqual(get_local_files(self.config, self.local_path), {})
+
+
+class TestValidateAndGetProvider(unittest.TestCase):
+    def setUp(self):
+        self.config = InMemoryConfigManager()
+        self.config.set("active_provider", "claude.ai", local=True)
+        self.config.set("active_organization_id", "org1", local=True)
+        self.config.set_session_key(
+            "claude.ai", "sk-ant-1234", datetime.now() + timedelta(days=1)
+        )
+
+    def test_reuses_provider_within_click_invocation(self):
+        with click.Context(click.Command("test")):
+            first = validate_and_get_provider(self.config)
+            self.assertIs(validate_and_get_provider(self.config), first)
+        self.assertIsNot(validate_and_get_provider(self.config), first)
+
+
+if __name__ == "__main__":
+    unittest.main()